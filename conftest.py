@@ -8,10 +8,12 @@ import os
 from pathlib import Path
 import pytest
 
-# プロジェクトルートをPythonパスに追加
+# プロジェクトルートをPythonパスに追加（同一プロセスでは一度だけ）
 project_root = str(Path(__file__).parent)
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+if not getattr(sys, "_stt_conftest_done", False):
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    sys._stt_conftest_done = True
 
 # カレントディレクトリをプロジェクトルートに設定
 os.chdir(Path(__file__).parent)
@@ -24,10 +26,13 @@ def pytest_configure(config):
     Args:
         config: pytestの設定オブジェクト
     """
-    # テストディレクトリをPythonパスに追加
-    test_dir = Path(__file__).parent / "src" / "tests"
-    if str(test_dir) not in sys.path:
-        sys.path.insert(0, str(test_dir))
+    # テストディレクトリをPythonパスに追加（同一プロセスでは一度だけ）
+    if getattr(sys, "_stt_test_dir_added", False):
+        return
+    test_dir = str(Path(project_root) / "src" / "tests")
+    if test_dir not in sys.path:
+        sys.path.insert(0, test_dir)
+    sys._stt_test_dir_added = True
 
 # pytestのコレクションフックを追加
 def pytest_collection_modifyitems(config, items):
@@ -4,24 +4,56 @@
 このモジュールは、アプリケーションのメインクラスを提供します。
 各サービスを連携させ、全体のワークフローを制御します。
 """
+import functools
 import os
 import time
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-from ..domain.media import MediaFile
+from ..domain.media import AUDIO_EXTENSIONS, SUPPORTED_EXTENSIONS, MediaChunk, MediaFile
 from ..domain.minutes import Minutes
 from ..domain.transcription import TranscriptionResult
-from ..infrastructure.config import config_manager
+from ..infrastructure.config import ConfigManager, config_manager
 from ..infrastructure.logger import logger
 from ..infrastructure.storage import storage_manager
 from ..services.class_info import class_info_service
 from ..services.hallucination import hallucination_service
 from ..services.media_processor import media_processor_service
 from ..services.minutes import minutes_generator_service
-from ..services.notion import notion_service
+from ..services.notion import is_notion_id, notion_service
 from ..services.transcription import transcription_service
 from ..services.video_analysis import video_analysis_service
+from ..utils.parallel import ParallelExecutionMode, ParallelExecutor, parallel_map
+
+
+@dataclass(frozen=True)
+class RunConfig:
+    """実行中に参照する設定値をまとめたデータクラス"""
+    input_dir: str  # デフォルトの入力ディレクトリ
+    moc_page_id: Optional[str]  # 親ページとして設定するMOCページのID
+    max_parallel_files: int  # 同時に処理するファイル数
+    max_parallel_chunks: int  # 同時に文字起こしするチャンク数
+
+    @classmethod
+    def from_config(cls, config: ConfigManager) -> "RunConfig":
+        """
+        設定管理から実行時の設定値を読み込む
+
+        Args:
+            config: 設定管理
+
+        Returns:
+            実行時の設定値
+        """
+        return cls(
+            input_dir=config.get("input_dir", "input"),
+            moc_page_id=config.get("notion.moc_page_id"),
+            max_parallel_files=config.get("parallel.max_parallel_files", 4),
+            # APIの動作不良を防ぐため、既定では1チャンクずつ文字起こしする（設定で変更した場合のみ並列化）
+            max_parallel_chunks=config.get("transcription.max_parallel_chunks", 1)
+        )
 
 
 class Application:
@@ -32,13 +64,16 @@ class Application:
         logger.info("アプリケーションを初期化しています...")
         self.config = config_manager
         self.storage = storage_manager
+        self.run_config = RunConfig.from_config(self.config)
 
-    def run(self, args: Dict) -> Dict:
+    def run(self, args: Dict, progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict:
         """
         アプリケーションを実行
 
         Args:
             args: コマンドライン引数
+            progress_callback: ファイルの処理が完了するたびに呼ばれる進捗コールバック関数
+                (completed_files, total_files) -> None
 
         Returns:
             実行結果の辞書
@@ -46,6 +81,9 @@ class Application:
         logger.info("アプリケーションを開始します")
         start_time = time.time()
 
+        # 実行中に参照する設定値を読み込む（ファイルごとに設定を検索しないようにする）
+        self.run_config = RunConfig.from_config(self.config)
+
         try:
             # 入力ファイルまたはディレクトリを取得
             input_path = self._get_input_path(args)
@@ -59,11 +97,17 @@ class Application:
 
             logger.info(f"{len(input_files)}個のファイルを処理します")
 
-            # 各ファイルを処理
-            results = []
-            for file_path in input_files:
-                result = self._process_file(file_path, args)
-                results.append(result)
+            if progress_callback:
+                progress_callback(0, len(input_files))
+
+            # 各ファイルを並列に処理（結果は入力ファイルの順序で返される）
+            results = parallel_map(
+                lambda file_path: self._process_file(file_path, args),
+                input_files,
+                ParallelExecutionMode.THREAD,
+                max_workers=self.run_config.max_parallel_files,
+                progress_callback=progress_callback
+            )
 
             # 処理時間を計算
             elapsed_time = time.time() - start_time
@@ -93,7 +137,7 @@ class Application:
             input_path = Path(args["input"])
         else:
             # デフォルトの入力ディレクトリ
-            input_path = Path(self.config.get("input_dir", "input"))
+            input_path = Path(self.run_config.input_dir)
 
         # パスが存在するか確認
         if not input_path.exists():
@@ -116,14 +160,15 @@ class Application:
 
         # ディレクトリの場合
         if input_path.is_dir():
-            # サポートする拡張子
-            audio_extensions = [".mp3", ".wav", ".aac", ".m4a", ".flac"]
-            video_extensions = [".mp4", ".avi", ".mov", ".mkv", ".webm"]
-            supported_extensions = audio_extensions + video_extensions
+            # ディレクトリを1回だけ走査し、サポートする拡張子でファイルを絞り込む
+            with os.scandir(input_path) as entries:
+                input_files = [
+                    Path(entry.path) for entry in entries
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                ]
 
-            # ディレクトリ内のファイルを検索
-            for ext in supported_extensions:
-                input_files.extend(list(input_path.glob(f"*{ext}")))
+            # 走査順はファイルシステムに依存するため、処理順が毎回同じになるようソート
+            input_files.sort()
 
             logger.info(f"ディレクトリから{len(input_files)}個のメディアファイルを見つけました: {input_path}")
         # ファイルの場合
@@ -148,9 +193,11 @@ class Application:
         file_start_time = time.time()
 
         try:
-            # メディアファイルを処理
-            media_file = media_processor_service.process_media_file(file_path)
-
+            # メディアファイルを処理（音声ファイルの場合は動画の判定を省略）
+            if file_path.suffix.lower() in AUDIO_EXTENSIONS:
+                media_file = media_processor_service.process_audio_file(file_path)
+            else:
+                media_file = media_processor_service.process_media_file(file_path)
 
             # 暗い動画の場合は音声を抽出
             if media_file.is_video and media_file.is_dark_video:
@@ -165,25 +212,23 @@ class Application:
                 # 各チャンクを個別に文字起こし
                 if media_file.has_chunks:
                     logger.info(f"各チャンクを個別に文字起こしします: {len(media_file.chunks)}個のチャンク")
-                    chunk_transcriptions = []
 
-                    for chunk in media_file.chunks:
-                        logger.info(f"チャンク {chunk.index} を文字起こしします: {chunk.file_path}")
-                        # チャンクから一時的なMediaFileオブジェクトを作成
-                        chunk_media = MediaFile(
-                            file_path=chunk.file_path,
-                            media_type=media_file.media_type,
-                            duration=chunk.end_time - chunk.start_time
+                    # チャンクを並列に文字起こし（結果はチャンクの順序で返される）
+                    with ParallelExecutor(ParallelExecutionMode.THREAD,
+                                          max_workers=self.run_config.max_parallel_chunks) as executor:
+                        chunk_results = executor.map(
+                            lambda chunk: self._transcribe_chunk(chunk, media_file),
+                            sorted(media_file.chunks, key=lambda chunk: chunk.index),
+                            task_id_prefix="chunk"
                         )
-                        # チャンクを文字起こし
-                        chunk_result = transcription_service.transcribe_audio(chunk_media)
 
-                        # 文字起こしに失敗した場合はスキップ
-                        if chunk_result.is_failed:
-                            logger.warning(f"チャンク {chunk.index} の文字起こしに失敗しました: {chunk.file_path}")
-                            continue
-
-                        chunk_transcriptions.append(chunk_result)
+                    # 文字起こしに失敗したチャンクは除外（失敗したチャンクはログに記録する）
+                    chunk_transcriptions = []
+                    for index, chunk_result in enumerate(chunk_results):
+                        if not chunk_result.success:
+                            logger.warning(f"チャンク {index} の文字起こし中にエラーが発生しました: {chunk_result.error}")
+                        elif chunk_result.result is not None:
+                            chunk_transcriptions.append(chunk_result.result)
 
                     # すべてのチャンクの文字起こし結果を結合
                     if chunk_transcriptions:
@@ -273,6 +318,33 @@ class Application:
             }
 
 
+    def _transcribe_chunk(self, chunk: MediaChunk, media_file: MediaFile) -> Optional[TranscriptionResult]:
+        """
+        メディアファイルのチャンクを文字起こし
+
+        Args:
+            chunk: メディアチャンク
+            media_file: 分割元のメディアファイル
+
+        Returns:
+            文字起こし結果、失敗した場合はNone
+        """
+        logger.info(f"チャンク {chunk.index} を文字起こしします: {chunk.file_path}")
+        # チャンクから一時的なMediaFileオブジェクトを作成
+        chunk_media = MediaFile(
+            file_path=chunk.file_path,
+            media_type=media_file.media_type,
+            duration=chunk.end_time - chunk.start_time
+        )
+        # チャンクを文字起こし
+        chunk_result = transcription_service.transcribe_audio(chunk_media)
+
+        # 文字起こしに失敗した場合はスキップ
+        if chunk_result.is_failed:
+            logger.warning(f"チャンク {chunk.index} の文字起こしに失敗しました: {chunk.file_path}")
+            return None
+
+        return chunk_result
 
     def _set_related_pages(self, minutes: Minutes) -> None:
         """
@@ -308,7 +380,6 @@ class Application:
 
                 # モック実装（実際の実装では削除）
                 # ランダムなページIDとタイトルを生成
-                import uuid
                 for i in range(2):  # 2つの関連ページを追加
                     page_id = str(uuid.uuid4())
                     page_title = f"{minutes.subject} 議事録 {i+1}"
@@ -327,7 +398,7 @@ class Application:
         """
         try:
             # MOCページを親ページとして設定
-            moc_page_id = self.config.get("notion.moc_page_id")
+            moc_page_id = self.run_config.moc_page_id
 
             # MOCページIDの検証
             if not moc_page_id:
@@ -335,10 +406,7 @@ class Application:
                 return
 
             # MOCページIDの形式チェック
-            import uuid
-            try:
-                uuid.UUID(moc_page_id)
-            except ValueError:
+            if not is_notion_id(moc_page_id):
                 logger.error(f"無効なMOCページIDの形式です: {moc_page_id}")
                 raise ValueError(f"無効なMOCページIDの形式です: {moc_page_id}")
 
@@ -368,5 +436,31 @@ class Application:
             # raise RuntimeError(f"親ページの設定に失敗しました: {e}")
 
 
-# シングルトンインスタンス
-app = Application()
+# シングルトンインスタンス（初回アクセス時に生成）
+@functools.lru_cache(maxsize=1)
+def get_app() -> Application:
+    """
+    アプリケーションのシングルトンインスタンスを取得
+
+    インスタンスは初回呼び出し時に生成します。コマンドライン引数で設定を上書きした後に
+    生成されるため、初期化時に読み込む設定にも引数の値が反映されます。
+
+    Returns:
+        アプリケーションインスタンス
+    """
+    return Application()
+
+
+def __getattr__(name: str):
+    """
+    従来の app 属性へのアクセスを get_app() に委譲する
+
+    Args:
+        name: 属性名
+
+    Returns:
+        属性の値
+    """
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,9 +10,9 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+from ..infrastructure import json_loader
 from ..infrastructure.config import config_manager
 from ..infrastructure.logger import logger
-from .app import app
 
 
 def parse_arguments() -> Dict:
@@ -90,6 +90,27 @@ def parse_arguments() -> Dict:
         default=600
     )
 
+    # 並列処理するファイル数
+    parser.add_argument(
+        "--max-parallel-files",
+        help="同時に処理するファイル数（省略時は設定ファイルの parallel.max_parallel_files）",
+        type=int,
+        default=None
+    )
+
+    # キャッシュ
+    parser.add_argument(
+        "--no-cache",
+        help="文字起こし結果のキャッシュを使用しない",
+        action="store_true"
+    )
+
+    parser.add_argument(
+        "--strict-cache",
+        help="キャッシュの参照時に常にファイル内容のハッシュ値を再計算する",
+        action="store_true"
+    )
+
     # 言語設定
     parser.add_argument(
         "--language",
@@ -165,17 +186,11 @@ def load_config_file(config_path: str) -> None:
     """
     config_path = Path(config_path)
 
-    if not config_path.exists():
-        logger.error(f"設定ファイルが見つかりません: {config_path}")
-        print(f"エラー: 設定ファイルが見つかりません: {config_path}")
-        sys.exit(1)
-
     try:
         # 設定ファイルの拡張子に応じて読み込み方法を変更
+        # （存在確認は行わず、開けなかった場合に FileNotFoundError で判定する）
         if config_path.suffix.lower() == ".json":
-            import json
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            config = json_loader.load_file(config_path)
         else:
             logger.error(f"サポートされていない設定ファイル形式です: {config_path}")
             print(f"エラー: サポートされていない設定ファイル形式です: {config_path}")
@@ -186,6 +201,10 @@ def load_config_file(config_path: str) -> None:
             config_manager.set(key, value)
 
         logger.info(f"設定ファイルを読み込みました: {config_path}")
+    except FileNotFoundError:
+        logger.error(f"設定ファイルが見つかりません: {config_path}")
+        print(f"エラー: 設定ファイルが見つかりません: {config_path}")
+        sys.exit(1)
     except Exception as e:
         logger.error(f"設定ファイルの読み込みに失敗しました: {e}")
         print(f"エラー: 設定ファイルの読み込みに失敗しました: {e}")
@@ -246,6 +265,17 @@ def override_config_from_args(args: Dict) -> None:
     if chunk_duration := args.get("chunk_duration"):
         config_manager.set("media_processor.chunk_duration", chunk_duration)
 
+    # 並列処理するファイル数
+    if max_parallel_files := args.get("max_parallel_files"):
+        config_manager.set("parallel.max_parallel_files", max_parallel_files)
+
+    # キャッシュ
+    if args.get("no_cache"):
+        config_manager.set("cache.enabled", False)
+
+    if args.get("strict_cache"):
+        config_manager.set("cache.strict", True)
+
     # 言語設定
     if language := args.get("language"):
         config_manager.set("language", language)
@@ -282,15 +312,12 @@ def print_progress(completed: int, total: int) -> None:
         percent = int(completed / total * 100)
 
     bar_length = 40
-    filled_length = int(bar_length * completed / total)
+    filled_length = bar_length * percent // 100
     bar = "=" * filled_length + "-" * (bar_length - filled_length)
 
     sys.stdout.write(f"\r進捗: [{bar}] {percent}% ({completed}/{total})")
     sys.stdout.flush()
 
-    if completed == total:
-        sys.stdout.write("\n")
-
 
 def print_result_summary(result: Dict) -> None:
     """
@@ -331,8 +358,11 @@ def main() -> int:
         # コマンドライン引数を解析
         args = parse_arguments()
 
-        # アプリケーションを実行
-        result = app.run(args)
+        # --help/--versionで終了する場合にサービス群を読み込まないよう、引数解析後にインポート
+        from .app import get_app
+
+        # アプリケーションを実行（ファイルの処理が完了するたびに進捗を表示）
+        result = get_app().run(args, progress_callback=print_progress)
 
         # 結果の要約を表示
         print_result_summary(result)
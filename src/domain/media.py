@@ -3,11 +3,20 @@
 
 このモジュールは、メディアファイル（音声・動画）に関するドメインモデルを定義します。
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
 from typing import List, Optional
 
+# 音声ファイルの拡張子
+AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".aac", ".m4a", ".flac"})
+
+# 動画ファイルの拡張子
+VIDEO_EXTENSIONS = frozenset({".mp4", ".avi", ".mov", ".mkv", ".webm"})
+
+# 処理対象とするメディアファイルの拡張子
+SUPPORTED_EXTENSIONS = AUDIO_EXTENSIONS | VIDEO_EXTENSIONS
+
 
 class MediaType(Enum):
     """メディアタイプを表す列挙型"""
@@ -23,42 +32,33 @@ class VideoQuality(Enum):
     UNKNOWN = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MediaChunk:
     """メディアファイルの分割チャンクを表すデータクラス"""
     start_time: float  # 開始時間（秒）
     end_time: float  # 終了時間（秒）
     file_path: Path  # チャンクファイルのパス
     index: int  # チャンクのインデックス
+    _hash: int = field(init=False, repr=False, compare=False)  # ハッシュ値（初期化時に計算）
+
+    def __post_init__(self):
+        """初期化後の処理"""
+        # 不変オブジェクトのため、ハッシュ値は一度だけ計算する
+        object.__setattr__(
+            self, "_hash", hash((self.start_time, self.end_time, self.file_path.as_posix(), self.index))
+        )
 
     def __hash__(self):
         """
-        ハッシュ値を計算するメソッド
+        ハッシュ値を返すメソッド
 
         Returns:
             int: ハッシュ値
         """
-        return hash((self.start_time, self.end_time, str(self.file_path), self.index))
-
-    def __eq__(self, other):
-        """
-        等価性を判定するメソッド
+        return self._hash
 
-        Args:
-            other: 比較対象のオブジェクト
 
-        Returns:
-            bool: 等価の場合はTrue、それ以外はFalse
-        """
-        if not isinstance(other, MediaChunk):
-            return False
-        return (self.start_time == other.start_time and
-                self.end_time == other.end_time and
-                self.file_path == other.file_path and
-                self.index == other.index)
-
-
-@dataclass
+@dataclass(slots=True)
 class MediaFile:
     """メディアファイルを表すドメインモデル"""
     file_path: Path  # ファイルパス
@@ -66,55 +66,32 @@ class MediaFile:
     duration: Optional[float] = None  # 長さ（秒）
     video_quality: Optional[VideoQuality] = None  # 動画の品質（動画の場合のみ）
     chunks: List[MediaChunk] = None  # 分割されたチャンク（分割された場合のみ）
+    # 以下は初期化時に media_type と duration から計算する判定結果
+    is_video: bool = field(init=False, repr=False, compare=False)  # 動画かどうか
+    is_audio: bool = field(init=False, repr=False, compare=False)  # 音声かどうか
+    is_long_media: bool = field(init=False, repr=False, compare=False)  # 40分（2400秒）以上かどうか
 
     def __post_init__(self):
         """初期化後の処理"""
         if self.chunks is None:
             self.chunks = []
 
-    @property
-    def is_long_media(self) -> bool:
-        """
-        長時間メディアかどうかを判定
-
-        Returns:
-            bool: 40分（2400秒）以上の場合はTrue、それ以外はFalse
-        """
-        if self.duration is None:
-            return False
-        return self.duration >= 2400  # 40分 = 2400秒
-
-    @property
-    def is_video(self) -> bool:
-        """
-        動画ファイルかどうかを判定
-
-        Returns:
-            bool: 動画の場合はTrue、それ以外はFalse
-        """
-        return self.media_type == MediaType.VIDEO
-
-    @property
-    def is_audio(self) -> bool:
-        """
-        音声ファイルかどうかを判定
-
-        Returns:
-            bool: 音声の場合はTrue、それ以外はFalse
-        """
-        return self.media_type == MediaType.AUDIO
+        # 処理中に何度も参照されるため、判定結果を一度だけ計算する
+        self.is_video = self.media_type is MediaType.VIDEO
+        self.is_audio = self.media_type is MediaType.AUDIO
+        self.is_long_media = self.duration is not None and self.duration >= 2400  # 40分 = 2400秒
 
     @property
     def is_dark_video(self) -> bool:
         """
         暗い動画かどうかを判定
 
+        video_quality は解析後に設定されるため、参照時に判定します。
+
         Returns:
             bool: 暗い動画の場合はTrue、それ以外はFalse
         """
-        if not self.is_video or self.video_quality is None:
-            return False
-        return self.video_quality == VideoQuality.DARK
+        return self.is_video and self.video_quality is VideoQuality.DARK
 
     @property
     def has_chunks(self) -> bool:
@@ -127,7 +104,7 @@ class MediaFile:
         return len(self.chunks) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedImage:
     """抽出された画像を表すデータクラス"""
     file_path: Path  # 画像ファイルのパス
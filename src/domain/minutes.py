@@ -7,7 +7,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from .media import ExtractedImage
 from .transcription import TranscriptionResult
@@ -31,7 +32,7 @@ class MinutesSection(Enum):
     IMAGES = auto()  # 画像セクション
 
 
-@dataclass
+@dataclass(slots=True)
 class MinutesHeading:
     """議事録の見出しを表すデータクラス"""
     text: str  # 見出しテキスト
@@ -39,7 +40,7 @@ class MinutesHeading:
     timestamp: Optional[float] = None  # 関連するタイムスタンプ（秒）
 
 
-@dataclass
+@dataclass(slots=True)
 class MinutesTask:
     """議事録内のタスク・宿題を表すデータクラス"""
     description: str  # タスクの説明
@@ -47,30 +48,43 @@ class MinutesTask:
     assignee: Optional[str] = None  # 担当者
 
 
-@dataclass
+@dataclass(slots=True)
 class GlossaryItem:
     """用語集の項目を表すデータクラス"""
     term: str  # 用語
     definition: str  # 定義
 
 
-@dataclass
+@dataclass(slots=True)
 class MinutesContent:
     """議事録の内容を表すデータクラス"""
     headings: List[MinutesHeading] = field(default_factory=list)  # 見出しのリスト
-    paragraphs: Dict[MinutesSection, List[str]] = field(default_factory=dict)  # セクション別の段落リスト
     tasks: List[MinutesTask] = field(default_factory=list)  # タスク・宿題のリスト
     glossary: List[GlossaryItem] = field(default_factory=list)  # 用語集のリスト
     images: List[ExtractedImage] = field(default_factory=list)  # 画像のリスト
+    # セクション別の段落リスト（MinutesSectionの値 - 1 をインデックスとする）
+    _paragraphs: List[List[str]] = field(init=False, repr=False)
+    _paragraphs_view: Mapping[MinutesSection, List[str]] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """初期化後の処理"""
         # paragraphsの初期化
-        if not self.paragraphs:
-            self.paragraphs = {section: [] for section in MinutesSection}
+        self._paragraphs = [[] for _ in MinutesSection]
+        # 各セクションのリストは置き換えないため、読み取り専用のビューは一度だけ作成する
+        self._paragraphs_view = MappingProxyType(dict(zip(MinutesSection, self._paragraphs)))
+
+    @property
+    def paragraphs(self) -> Mapping[MinutesSection, List[str]]:
+        """
+        セクション別の段落リスト（読み取り専用）
+
+        Returns:
+            セクションをキーとする段落リストのマッピング
+        """
+        return self._paragraphs_view
 
 
-@dataclass
+@dataclass(slots=True)
 class Minutes:
     """議事録を表すドメインモデル"""
     title: str  # タイトル
@@ -80,7 +94,7 @@ class Minutes:
     format: MinutesFormat = MinutesFormat.MARKDOWN  # フォーマット
     lecturer: Optional[str] = None  # 講師名
     subject: Optional[str] = None  # 科目名
-    attendees: List[str] = field(default_factory=list)  # 出席者リスト
+    attendees: Tuple[str, ...] = ()  # 出席者（作成後はほとんど変更されないためタプルで保持）
     metadata: Dict = field(default_factory=dict)  # メタデータ
     output_path: Optional[Path] = None  # 出力先パス
     related_pages: Dict[str, str] = field(default_factory=dict)  # 関連ページ（ページID: タイトル）
@@ -161,9 +175,16 @@ class Minutes:
             section: 追加するセクション
             text: 追加するテキスト
         """
-        if section not in self.content.paragraphs:
-            self.content.paragraphs[section] = []
-        self.content.paragraphs[section].append(text)
+        self.content._paragraphs[section.value - 1].append(text)
+
+    def add_attendee(self, name: str) -> None:
+        """
+        出席者を追加
+
+        Args:
+            name: 出席者名
+        """
+        self.attendees = (*self.attendees, name)
 
     def add_related_page(self, page_id: str, title: str) -> None:
         """
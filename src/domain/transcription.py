@@ -3,10 +3,13 @@
 
 このモジュールは、文字起こしに関するドメインモデルを定義します。
 """
+import bisect
+import itertools
+import sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class TranscriptionStatus(Enum):
@@ -25,14 +28,39 @@ class HallucinationSeverity(Enum):
     HIGH = auto()  # 重度のハルシネーション
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Speaker:
     """話者を表すデータクラス"""
     id: str  # 話者ID
     name: Optional[str] = None  # 話者名
 
+    @classmethod
+    def get(cls, id: str, name: Optional[str] = None) -> "Speaker":
+        """
+        話者を取得（同じIDと名前の話者は同じインスタンスを共有）
+
+        Args:
+            id: 話者ID
+            name: 話者名
+
+        Returns:
+            話者
+        """
+        key = (id, name)
+        speaker = _SPEAKER_CACHE.get(key)
+        if speaker is None:
+            speaker = _SPEAKER_CACHE.setdefault(
+                key, cls(sys.intern(id), sys.intern(name) if name is not None else None)
+            )
+        return speaker
+
+
+# 話者のキャッシュ（(話者ID, 話者名) -> 話者）
+# 1つの文字起こしに登場する話者は数人程度のため、上限は設けない
+_SPEAKER_CACHE: Dict[Tuple[str, Optional[str]], Speaker] = {}
+
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionSegment:
     """文字起こしの一部分（発言単位）を表すデータクラス"""
     text: str  # 文字起こしテキスト
@@ -42,7 +70,7 @@ class TranscriptionSegment:
     confidence: float = 1.0  # 信頼度
 
 
-@dataclass
+@dataclass(slots=True)
 class HallucinationResult:
     """ハルシネーションチェック結果を表すデータクラス"""
     segment: TranscriptionSegment  # チェック対象のセグメント
@@ -51,7 +79,7 @@ class HallucinationResult:
     corrected_text: Optional[str] = None  # 修正されたテキスト（ある場合）
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionResult:
     """文字起こし結果を表すドメインモデル"""
     source_file: Path  # 元のメディアファイルのパス
@@ -59,26 +87,43 @@ class TranscriptionResult:
     status: TranscriptionStatus = TranscriptionStatus.PENDING  # 文字起こしの状態
     hallucination_results: List[HallucinationResult] = field(default_factory=list)  # ハルシネーションチェック結果
     metadata: Dict = field(default_factory=dict)  # メタデータ
+    # リストから計算した値のキャッシュ（(計算元のリスト, 要素数, 値)）
+    _full_text_cache: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
+    _segment_index: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
+    _hallucination_count: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def full_text(self) -> str:
         """
         すべてのセグメントを結合した完全なテキストを取得
+
+        結合結果はキャッシュし、セグメントのリストが置き換えられたり要素数が変わったりした場合に
+        作り直します。セグメントのテキストを直接書き換えた場合は invalidate_cache() を呼び出してください。
         
         Returns:
             str: 完全な文字起こしテキスト
         """
-        return "\n".join(segment.text for segment in self.segments)
+        if self._is_cache_valid(self._full_text_cache, self.segments):
+            return self._full_text_cache[2]
+
+        full_text = "\n".join(segment.text for segment in self.segments)
+        self._full_text_cache = (self.segments, len(self.segments), full_text)
+        return full_text
 
     @property
     def has_hallucinations(self) -> bool:
         """
         ハルシネーションが検出されたかどうかを判定
+
+        ハルシネーションと判定された結果の数をキャッシュし、毎回すべての結果を走査しないようにします。
         
         Returns:
             bool: ハルシネーションがある場合はTrue、それ以外はFalse
         """
-        return any(result.severity != HallucinationSeverity.NONE for result in self.hallucination_results)
+        if not self._is_cache_valid(self._hallucination_count, self.hallucination_results):
+            count = sum(result.severity is not HallucinationSeverity.NONE for result in self.hallucination_results)
+            self._hallucination_count = (self.hallucination_results, len(self.hallucination_results), count)
+        return self._hallucination_count[2] > 0
 
     @property
     def is_completed(self) -> bool:
@@ -88,7 +133,7 @@ class TranscriptionResult:
         Returns:
             bool: 完了している場合はTrue、それ以外はFalse
         """
-        return self.status == TranscriptionStatus.COMPLETED
+        return self.status is TranscriptionStatus.COMPLETED
 
     @property
     def is_failed(self) -> bool:
@@ -98,7 +143,7 @@ class TranscriptionResult:
         Returns:
             bool: 失敗した場合はTrue、それ以外はFalse
         """
-        return self.status == TranscriptionStatus.FAILED
+        return self.status is TranscriptionStatus.FAILED
 
     def get_segment_at_time(self, time: float) -> Optional[TranscriptionSegment]:
         """
@@ -110,7 +155,88 @@ class TranscriptionResult:
         Returns:
             Optional[TranscriptionSegment]: 該当するセグメント、ない場合はNone
         """
-        for segment in self.segments:
-            if segment.start_time <= time <= segment.end_time:
-                return segment
-        return None
\ No newline at end of file
+        index = self._get_segment_index()
+        if index is None:
+            # 開始時間順に並んでいない場合は先頭から順に検索
+            for segment in self.segments:
+                if segment.start_time <= time <= segment.end_time:
+                    return segment
+            return None
+
+        start_times, max_end_times = index
+
+        # 開始時間が指定時間以前の最後のセグメント
+        last = bisect.bisect_right(start_times, time) - 1
+        # 終了時間が指定時間以降となる最初のセグメント（先頭からの終了時間の最大値で二分探索）
+        first = bisect.bisect_left(max_end_times, time)
+
+        if first <= last:
+            return self.segments[first]
+        return None
+
+    def _get_segment_index(self) -> Optional[Tuple[List[float], List[float]]]:
+        """
+        セグメント検索用のインデックスを取得
+
+        セグメントのリストが置き換えられたり、要素数が変わったりした場合は作り直します。
+
+        Returns:
+            Optional[Tuple[List[float], List[float]]]: 開始時間のリストと、先頭からの終了時間の最大値のリスト。
+                セグメントが開始時間順に並んでいない場合はNone
+        """
+        if self._is_cache_valid(self._segment_index, self.segments):
+            return self._segment_index[2]
+
+        start_times = [segment.start_time for segment in self.segments]
+        if any(previous > current for previous, current in zip(start_times, start_times[1:])):
+            index = None
+        else:
+            max_end_times = list(itertools.accumulate((segment.end_time for segment in self.segments), max))
+            index = (start_times, max_end_times)
+
+        self._segment_index = (self.segments, len(self.segments), index)
+        return index
+
+    @staticmethod
+    def _is_cache_valid(cache: Optional[Tuple], values: List) -> bool:
+        """
+        リストから計算した値のキャッシュが現在のリストに対応しているかを判定
+
+        Args:
+            cache: (計算元のリスト, 要素数, 値) のタプル
+            values: 現在のリスト
+
+        Returns:
+            bool: 有効な場合はTrue、それ以外はFalse
+        """
+        return cache is not None and cache[0] is values and cache[1] == len(values)
+
+    def add_segment(self, segment: TranscriptionSegment) -> None:
+        """
+        セグメントを追加
+
+        Args:
+            segment: 追加するセグメント
+        """
+        self.segments.append(segment)
+        self.invalidate_cache()
+
+    def add_hallucination_result(self, result: HallucinationResult) -> None:
+        """
+        ハルシネーションチェック結果を追加
+
+        Args:
+            result: 追加するハルシネーションチェック結果
+        """
+        cache = self._hallucination_count
+        is_valid = self._is_cache_valid(cache, self.hallucination_results)
+        self.hallucination_results.append(result)
+        if is_valid:
+            count = cache[2] + (result.severity is not HallucinationSeverity.NONE)
+            self._hallucination_count = (self.hallucination_results, len(self.hallucination_results), count)
+
+    def invalidate_cache(self) -> None:
+        """リストから計算した値のキャッシュを破棄"""
+        self._full_text_cache = None
+        self._segment_index = None
+        self._hallucination_count = None
\ No newline at end of file
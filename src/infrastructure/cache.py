@@ -0,0 +1,171 @@
+"""
+キャッシュモジュール
+
+このモジュールは、処理結果をディスクにキャッシュする機能を提供します。
+結果はpickle化してSQLiteデータベースに保存し、合計サイズが上限を超えた場合は
+最も長く参照されていないエントリから削除します（LRU）。
+"""
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .logger import logger
+
+# ファイルのハッシュ計算時に一度に読み込むサイズ
+_DIGEST_BLOCK_SIZE = 1024 * 1024
+
+
+def file_digest(file_path: Union[str, Path]) -> str:
+    """
+    ファイル内容のハッシュ値を計算
+
+    Args:
+        file_path: ファイルのパス
+
+    Returns:
+        ハッシュ値（16進数文字列）
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(file_path, "rb") as f:
+        while block := f.read(_DIGEST_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_fingerprint(file_path: Union[str, Path]) -> str:
+    """
+    ファイルの絶対パス・サイズ・更新日時から識別子を生成
+
+    ファイル内容を読み込まないため、file_digest より高速に計算できます。
+
+    Args:
+        file_path: ファイルのパス
+
+    Returns:
+        ファイルの識別子
+    """
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class ResultCache:
+    """SQLiteを使用した結果キャッシュクラス"""
+
+    def __init__(self, db_path: Union[str, Path], max_size: int):
+        """
+        初期化
+
+        データベースへの接続は最初にキャッシュを使用したときに行います。
+
+        Args:
+            db_path: データベースファイルのパス
+            max_size: キャッシュの最大合計サイズ（バイト）
+        """
+        self.db_path = Path(db_path)
+        self.max_size = max_size
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        データベースに接続（未接続の場合のみ）
+
+        Returns:
+            データベース接続
+        """
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # 複数スレッドから使用するため、接続はロックで保護する
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        キャッシュから値を取得
+
+        Args:
+            key: キー
+
+        Returns:
+            キャッシュされた値、存在しない場合はNone
+        """
+        with self._lock:
+            try:
+                connection = self._connect()
+                row = connection.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+
+                # 参照日時を更新
+                connection.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+                connection.commit()
+                return pickle.loads(row[0])
+            except Exception as e:
+                logger.warning(f"キャッシュの読み込みに失敗しました: {key} - {e}")
+                return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        値をキャッシュに保存
+
+        Args:
+            key: キー
+            value: 保存する値（pickle化できるもの）
+        """
+        with self._lock:
+            try:
+                data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, size, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, data, len(data), time.time())
+                )
+                self._evict(connection)
+                connection.commit()
+            except Exception as e:
+                logger.warning(f"キャッシュの保存に失敗しました: {key} - {e}")
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """
+        合計サイズが上限を超えている場合、参照日時の古いエントリから削除
+
+        Args:
+            connection: データベース接続
+        """
+        total_size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if total_size <= self.max_size:
+            return
+
+        rows = connection.execute("SELECT key, size FROM cache ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total_size <= self.max_size:
+                break
+            connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+            total_size -= size
+            logger.debug(f"キャッシュエントリを削除しました: {key}")
+
+    def clear(self) -> None:
+        """キャッシュをすべて削除"""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM cache")
+            connection.commit()
+
+    def close(self) -> None:
+        """データベース接続を閉じる"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
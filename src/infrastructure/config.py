@@ -4,10 +4,18 @@
 このモジュールは、アプリケーションの設定を管理するための機能を提供します。
 環境変数と設定ファイルから設定を読み込み、優先順位に基づいて適用します。
 """
-import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from . import json_loader
+
+# 設定ディレクトリ内の設定ファイルと読み込み先のキー（Noneの場合は最上位に統合）
+_CONFIG_FILES: Tuple[Tuple[str, Optional[str]], ...] = (
+    ("settings.json", None),  # 一般設定ファイル
+    ("notion.json", "notion"),  # Notion設定ファイル
+    ("logging.json", "logging"),  # ログ設定ファイル
+)
 
 
 class ConfigManager:
@@ -22,29 +30,31 @@ class ConfigManager:
         """
         self.config_dir = Path(config_dir)
         self.settings = {}
+        # ドット区切りキーの検索結果のキャッシュ（キー: (バージョン, 設定辞書, 見つかったか, 値)）
+        self._version = 0
+        self._get_cache: Dict[str, Tuple[int, Dict, bool, Any]] = {}
         self._load_settings()
 
     def _load_settings(self) -> None:
         """
         設定ファイルから設定を読み込む
         """
-        # 一般設定ファイル
-        settings_path = self.config_dir / "settings.json"
-        if settings_path.exists():
-            with open(settings_path, "r", encoding="utf-8") as f:
-                self.settings.update(json.load(f))
-
-        # Notion設定ファイル
-        notion_path = self.config_dir / "notion.json"
-        if notion_path.exists():
-            with open(notion_path, "r", encoding="utf-8") as f:
-                self.settings["notion"] = json.load(f)
-
-        # ログ設定ファイル
-        logging_path = self.config_dir / "logging.json"
-        if logging_path.exists():
-            with open(logging_path, "r", encoding="utf-8") as f:
-                self.settings["logging"] = json.load(f)
+        # ディレクトリを一度だけ走査し、存在する設定ファイルのみ読み込む
+        try:
+            with os.scandir(self.config_dir) as entries:
+                config_files = {entry.name: entry.path for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            config_files = {}
+
+        for file_name, key in _CONFIG_FILES:
+            file_path = config_files.get(file_name)
+            if file_path is None:
+                continue
+            data = json_loader.load_file(file_path)
+            if key is None:
+                self.settings.update(data)
+            else:
+                self.settings[key] = data
 
         # 環境変数から設定を上書き
         self._load_from_env()
@@ -54,6 +64,8 @@ class ConfigManager:
         環境変数から設定を読み込む
         環境変数は設定ファイルよりも優先される
         """
+        self._version += 1
+
         # APIキー
         if gemini_api_key := os.environ.get("GEMINI_API_KEY"):
             self.settings["gemini_api_key"] = gemini_api_key
@@ -87,16 +99,25 @@ class ConfigManager:
         Returns:
             設定値
         """
-        # ドット区切りのキーを処理
+        # ドット区切りのキーを処理（設定が変更されていなければ前回の検索結果を使用）
         if "." in key:
+            cached = self._get_cache.get(key)
+            if cached is not None and cached[0] == self._version and cached[1] is self.settings:
+                return cached[3] if cached[2] else default
+
             parts = key.split(".")
             current = self.settings
+            found = True
             for part in parts:
                 if isinstance(current, dict) and part in current:
                     current = current[part]
                 else:
-                    return default
-            return current
+                    found = False
+                    current = None
+                    break
+
+            self._get_cache[key] = (self._version, self.settings, found, current)
+            return current if found else default
 
         return self.settings.get(key, default)
 
@@ -108,6 +129,9 @@ class ConfigManager:
             key: 設定キー（ドット区切りで階層指定可能）
             value: 設定値
         """
+        # 検索結果のキャッシュを無効化
+        self._version += 1
+
         # ドット区切りのキーを処理
         if "." in key:
             parts = key.split(".")
@@ -129,20 +153,17 @@ class ConfigManager:
                            if k not in ["notion", "logging"]}
 
         settings_path = self.config_dir / "settings.json"
-        with open(settings_path, "w", encoding="utf-8") as f:
-            json.dump(general_settings, f, indent=4, ensure_ascii=False)
+        settings_path.write_bytes(json_loader.dumps(general_settings))
 
         # Notion設定
         if "notion" in self.settings:
             notion_path = self.config_dir / "notion.json"
-            with open(notion_path, "w", encoding="utf-8") as f:
-                json.dump(self.settings["notion"], f, indent=4, ensure_ascii=False)
+            notion_path.write_bytes(json_loader.dumps(self.settings["notion"]))
 
         # ログ設定
         if "logging" in self.settings:
             logging_path = self.config_dir / "logging.json"
-            with open(logging_path, "w", encoding="utf-8") as f:
-                json.dump(self.settings["logging"], f, indent=4, ensure_ascii=False)
+            logging_path.write_bytes(json_loader.dumps(self.settings["logging"]))
 
     def _load_api_key_from_file(self, service: str) -> Optional[str]:
         """
@@ -163,11 +184,12 @@ class ConfigManager:
             return None
 
         try:
-            with open(api_key_path, "r", encoding="utf-8") as f:
-                api_keys = json.load(f)
-                return api_keys.get(service, {}).get("api_key")
-        except Exception as e:
-            print(f"APIキーファイルの読み込みに失敗しました: {e}")
+            api_keys = json_loader.load_file(api_key_path)
+            return api_keys.get(service, {}).get("api_key")
+        except (OSError, json_loader.JSONDecodeError, AttributeError) as e:
+            # loggerはconfigを参照するため、循環インポートを避けてここでインポートする
+            from .logger import logger
+            logger.warning(f"APIキーファイルの読み込みに失敗しました: {e}")
             return None
 
     def get_api_key(self, service: str) -> Optional[str]:
@@ -205,8 +227,7 @@ class ConfigManager:
             output_dir = output_dir / subdir
 
         # ディレクトリが存在しない場合は作成
-        if not output_dir.exists():
-            output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
 
         return output_dir
 
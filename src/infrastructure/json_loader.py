@@ -0,0 +1,206 @@
+"""
+JSON読み込みモジュール
+
+このモジュールは、設定ファイルや言語ファイルなどのJSONを解析する関数と、
+出力ファイル用にJSONをシリアライズする関数を提供します。
+orjsonがインストールされている場合はそちらを使用し、ない場合は標準のjsonモジュールを使用します。
+"""
+import dataclasses
+import json
+import mmap
+import os
+from datetime import date, datetime, time
+from enum import Enum
+from pathlib import Path, PurePath
+from types import MappingProxyType
+from typing import IO, Any, Dict, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjsonは任意の依存関係
+    orjson = None
+
+# 解析エラー（orjson.JSONDecodeError は json.JSONDecodeError のサブクラス）
+JSONDecodeError = json.JSONDecodeError
+
+# orjsonでのシリアライズ時のオプション
+# （データクラスは標準のjsonモジュールと同じ形式になるよう _default で変換する）
+_ORJSON_DUMPS_OPTION = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None else 0
+)
+
+# このサイズ以上のファイルはmmapで読み込む（小さいファイルは通常の読み込みの方が速い）
+MMAP_THRESHOLD = 1024 * 1024
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    JSON文字列を解析する
+
+    Args:
+        data: JSON文字列またはバイト列
+
+    Returns:
+        解析結果
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def load(fp: IO) -> Any:
+    """
+    ファイルオブジェクトからJSONを読み込んで解析する
+
+    Args:
+        fp: 読み込み用に開かれたファイルオブジェクト（テキスト・バイナリどちらでも可）
+
+    Returns:
+        解析結果
+    """
+    return loads(fp.read())
+
+
+def load_file(file_path: Union[str, Path]) -> Any:
+    """
+    JSONファイルを読み込んで解析する
+
+    バイナリモードで読み込むため、文字列へのデコードを挟みません。
+    orjsonが使用でき、ファイルサイズが MMAP_THRESHOLD 以上の場合は、
+    mmapしたファイルを直接解析してファイル内容のコピーを作りません。
+
+    Args:
+        file_path: JSONファイルのパス
+
+    Returns:
+        解析結果
+    """
+    with open(file_path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return loads(f.read())
+
+
+def dumps(data: Any) -> bytes:
+    """
+    データを2スペースでインデントしたJSON（UTF-8バイト列）に変換する
+
+    非ASCII文字はエスケープせずにそのまま出力します（ensure_ascii=False 相当）。
+    データクラス・列挙型・日時・パスもそのまま変換できます（asdictでの事前変換は不要）。
+    データクラスは公開フィールドの辞書に変換します。"_" で始まる非公開フィールドは出力せず、
+    同名の公開プロパティ（"_paragraphs" に対する "paragraphs" など）がある場合のみその値を出力します。
+    辞書の列挙型・日時のキーは値・ISO形式の文字列に変換します（orjsonの OPT_NON_STR_KEYS と同じ形式）。
+    orjsonの有無にかかわらず同じ形式で出力されます。
+
+    Args:
+        data: 変換するデータ
+
+    Returns:
+        JSONのバイト列
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=_ORJSON_DUMPS_OPTION)
+    # 標準のjsonモジュールは文字列・数値・真偽値・None以外のキーを変換できないため、事前にキーを変換する
+    return json.dumps(
+        _normalize_keys(data), ensure_ascii=False, indent=2, default=_default_normalized
+    ).encode("utf-8")
+
+
+def _default(obj: Any) -> Any:
+    """
+    JSONに直接変換できないオブジェクトを変換する（orjsonと標準のjsonモジュールで共通）
+
+    Args:
+        obj: 変換するオブジェクト
+
+    Returns:
+        JSONに変換可能な値
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _dataclass_to_dict(obj)
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, PurePath):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dataclass_to_dict(obj: Any) -> Dict[str, Any]:
+    """
+    データクラスを公開フィールドの辞書に変換する
+
+    Args:
+        obj: データクラスのインスタンス
+
+    Returns:
+        フィールド名と値の辞書
+    """
+    result = {}
+    for f in dataclasses.fields(obj):
+        name = f.name
+        if name.startswith("_"):
+            # 非公開フィールドは、同名の公開プロパティがある場合のみその値を出力
+            name = name[1:]
+            if not isinstance(getattr(type(obj), name, None), property):
+                continue
+        result[name] = getattr(obj, name)
+    return result
+
+
+def _default_normalized(obj: Any) -> Any:
+    """
+    _default で変換した結果に含まれる辞書のキーを、標準のjsonモジュールで変換できる形式にする
+
+    Args:
+        obj: 変換するオブジェクト
+
+    Returns:
+        JSONに変換可能な値
+    """
+    return _normalize_keys(_default(obj))
+
+
+def _normalize_keys(obj: Any) -> Any:
+    """
+    辞書のキーを再帰的に変換する（orjsonの OPT_NON_STR_KEYS と同じ形式）
+
+    Args:
+        obj: 変換するデータ
+
+    Returns:
+        キーを変換したデータ
+    """
+    if isinstance(obj, dict):
+        return {_normalize_key(key): _normalize_keys(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_normalize_keys(value) for value in obj]
+    return obj
+
+
+def _normalize_key(key: Any) -> Any:
+    """
+    辞書のキーを標準のjsonモジュールで変換できる値にする
+
+    Args:
+        key: 辞書のキー
+
+    Returns:
+        変換後のキー（文字列・数値・真偽値・Noneはそのまま）
+    """
+    if isinstance(key, str):
+        return key
+    if isinstance(key, Enum):
+        return _normalize_key(key.value)
+    if isinstance(key, (datetime, date, time)):
+        return key.isoformat()
+    return key
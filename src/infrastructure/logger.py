@@ -4,10 +4,13 @@
 このモジュールは、アプリケーションのログ機能を提供します。
 構造化ログを出力し、ログレベルに応じた適切なログ記録を行います。
 """
+import atexit
 import json
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -22,6 +25,8 @@ class Logger:
     def __init__(self):
         """初期化"""
         self.logger = logging.getLogger("tts-mcp")
+        # ハンドラへの出力を行うバックグラウンドのリスナー（デフォルト設定の場合のみ）
+        self._listener: Optional[logging.handlers.QueueListener] = None
         self._configure_logger()
 
     def _configure_logger(self) -> None:
@@ -76,76 +81,93 @@ class Logger:
         file_handler.setFormatter(file_formatter)
 
         # ハンドラの追加
-        root_logger.addHandler(console_handler)
-        root_logger.addHandler(file_handler)
+        # ログ呼び出し側はキューへの追加のみ行い、出力はバックグラウンドのスレッドで行う
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        # 終了時にキューに残ったログを出力する
+        atexit.register(self._listener.stop)
 
         # アプリケーションロガーの設定
         self.logger.setLevel(log_level)
 
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args, **kwargs) -> None:
         """
         DEBUGレベルのログを出力
 
         Args:
-            message: ログメッセージ
+            message: ログメッセージ（%形式の書式を含められる）
+            *args: メッセージの書式引数（ログを出力する場合のみ適用）
             **kwargs: 追加のコンテキスト情報
         """
-        self._log(logging.DEBUG, message, **kwargs)
+        self._log(logging.DEBUG, message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """
         INFOレベルのログを出力
 
         Args:
-            message: ログメッセージ
+            message: ログメッセージ（%形式の書式を含められる）
+            *args: メッセージの書式引数（ログを出力する場合のみ適用）
             **kwargs: 追加のコンテキスト情報
         """
-        self._log(logging.INFO, message, **kwargs)
+        self._log(logging.INFO, message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         """
         WARNINGレベルのログを出力
 
         Args:
-            message: ログメッセージ
+            message: ログメッセージ（%形式の書式を含められる）
+            *args: メッセージの書式引数（ログを出力する場合のみ適用）
             **kwargs: 追加のコンテキスト情報
         """
-        self._log(logging.WARNING, message, **kwargs)
+        self._log(logging.WARNING, message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args, **kwargs) -> None:
         """
         ERRORレベルのログを出力
 
         Args:
-            message: ログメッセージ
+            message: ログメッセージ（%形式の書式を含められる）
+            *args: メッセージの書式引数（ログを出力する場合のみ適用）
             **kwargs: 追加のコンテキスト情報
         """
-        self._log(logging.ERROR, message, **kwargs)
+        self._log(logging.ERROR, message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: str, *args, **kwargs) -> None:
         """
         CRITICALレベルのログを出力
 
         Args:
-            message: ログメッセージ
+            message: ログメッセージ（%形式の書式を含められる）
+            *args: メッセージの書式引数（ログを出力する場合のみ適用）
             **kwargs: 追加のコンテキスト情報
         """
-        self._log(logging.CRITICAL, message, **kwargs)
+        self._log(logging.CRITICAL, message, *args, **kwargs)
 
-    def _log(self, level: int, message: str, **kwargs) -> None:
+    def _log(self, level: int, message: str, *args, **kwargs) -> None:
         """
         ログを出力
 
         Args:
             level: ログレベル
-            message: ログメッセージ
+            message: ログメッセージ（%形式の書式を含められる）
+            *args: メッセージの書式引数（ログを出力する場合のみ適用）
             **kwargs: 追加のコンテキスト情報
         """
-        # 構造化ログのためのコンテキスト情報
-        extra = {"context": kwargs} if kwargs else {}
+        # 出力されないレベルの場合は何もしない
+        if not self.logger.isEnabledFor(level):
+            return
 
-        # ログ出力
-        self.logger.log(level, message, extra=extra)
+        # ログ出力（コンテキスト情報がある場合のみ構造化ログとして渡す）
+        if kwargs:
+            self.logger.log(level, message, *args, extra={"context": kwargs})
+        else:
+            self.logger.log(level, message, *args)
 
     def log_exception(self, message: str, exc: Optional[Exception] = None, **kwargs) -> None:
         """
@@ -3,23 +3,67 @@
 
 このモジュールは、ファイルの保存や読み込みなどのストレージ関連の機能を提供します。
 """
-import json
+import fnmatch
 import os
 import shutil
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
+from . import json_loader
 from .config import config_manager
 from .logger import logger
 
 
+@lru_cache(maxsize=128)
+def _read_text_cached(file_path: str, mtime_ns: int, size: int) -> str:
+    """
+    テキストファイルを読み込み、更新時刻とサイズが同じ間は内容を再利用する
+
+    Args:
+        file_path: 読み込むファイルパス
+        mtime_ns: ファイルの更新時刻（ナノ秒）
+        size: ファイルサイズ
+
+    Returns:
+        ファイルの内容
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    logger.debug("テキストファイルを読み込みました: %s", file_path)
+    return content
+
+
+def _make_dir(path: Path) -> bool:
+    """
+    ディレクトリを作成（親ディレクトリも含む）
+
+    Args:
+        path: 作成するディレクトリのパス
+
+    Returns:
+        新たに作成した場合はTrue、既に存在していた場合はFalse
+    """
+    try:
+        path.mkdir(parents=True)
+    except FileExistsError:
+        return False
+    return True
+
+
 class StorageManager:
     """ストレージ管理クラス"""
 
+    # 属性を固定して属性アクセスを高速化する
+    __slots__ = ("base_output_dir", "_output_dirs")
+
     def __init__(self):
         """初期化"""
         self.base_output_dir = Path(config_manager.get("output_dir", "output"))
+        # 作成済みの出力サブディレクトリ（サブディレクトリ名 -> パス）
+        self._output_dirs: Dict[str, Path] = {}
         self._ensure_output_dirs()
 
     def _ensure_output_dirs(self) -> None:
@@ -27,17 +71,16 @@ class StorageManager:
         出力ディレクトリの存在を確認し、必要に応じて作成
         """
         # 基本出力ディレクトリ
-        if not self.base_output_dir.exists():
-            self.base_output_dir.mkdir(parents=True, exist_ok=True)
+        if _make_dir(self.base_output_dir):
             logger.info(f"出力ディレクトリを作成しました: {self.base_output_dir}")
 
         # サブディレクトリ
         subdirs = ["transcripts", "minutes", "images", "reports"]
         for subdir in subdirs:
             path = self.base_output_dir / subdir
-            if not path.exists():
-                path.mkdir(parents=True, exist_ok=True)
+            if _make_dir(path):
                 logger.info(f"サブディレクトリを作成しました: {path}")
+            self._output_dirs[subdir] = path
 
     def get_output_dir(self, subdir: Optional[str] = None) -> Path:
         """
@@ -50,9 +93,14 @@ class StorageManager:
             出力ディレクトリのパス
         """
         if subdir:
+            # 作成済みのディレクトリは存在確認を省略
+            output_dir = self._output_dirs.get(subdir)
+            if output_dir is not None:
+                return output_dir
+
             output_dir = self.base_output_dir / subdir
-            if not output_dir.exists():
-                output_dir.mkdir(parents=True, exist_ok=True)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dirs[subdir] = output_dir
             return output_dir
         return self.base_output_dir
 
@@ -68,15 +116,12 @@ class StorageManager:
             講義ごとの出力ディレクトリのパス
         """
         lecture_dir = self.base_output_dir / lecture_id
-        if not lecture_dir.exists():
-            lecture_dir.mkdir(parents=True, exist_ok=True)
-            
         if subdir:
             subdir_path = lecture_dir / subdir
-            if not subdir_path.exists():
-                subdir_path.mkdir(parents=True, exist_ok=True)
+            subdir_path.mkdir(parents=True, exist_ok=True)
             return subdir_path
-            
+
+        lecture_dir.mkdir(parents=True, exist_ok=True)
         return lecture_dir
 
     def save_text(self, content: str, file_path: Union[str, Path]) -> Path:
@@ -93,13 +138,12 @@ class StorageManager:
         file_path = Path(file_path)
         
         # ディレクトリが存在しない場合は作成
-        if not file_path.parent.exists():
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
             
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(content)
             
-        logger.debug(f"テキストファイルを保存しました: {file_path}")
+        logger.debug("テキストファイルを保存しました: %s", file_path)
         return file_path
 
     def save_json(self, data: Any, file_path: Union[str, Path]) -> Path:
@@ -116,21 +160,22 @@ class StorageManager:
         file_path = Path(file_path)
         
         # ディレクトリが存在しない場合は作成
-        if not file_path.parent.exists():
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            
-        logger.debug(f"JSONファイルを保存しました: {file_path}")
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # データクラスも含めてバイト列に直接変換して書き込む
+        file_path.write_bytes(json_loader.dumps(data))
+
+        logger.debug("JSONファイルを保存しました: %s", file_path)
         return file_path
 
-    def load_text(self, file_path: Union[str, Path]) -> str:
+    def load_text(self, file_path: Union[str, Path], cache: bool = False) -> str:
         """
         テキストファイルを読み込む
         
         Args:
             file_path: 読み込むファイルパス
+            cache: Trueの場合、ファイルが更新されていなければ前回の内容を再利用する
+                （プロンプトなど繰り返し読み込む静的なファイル向け）
             
         Returns:
             ファイルの内容
@@ -140,11 +185,15 @@ class StorageManager:
         if not file_path.exists():
             logger.warning(f"ファイルが存在しません: {file_path}")
             return ""
+
+        if cache:
+            stat = file_path.stat()
+            return _read_text_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
             
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
             
-        logger.debug(f"テキストファイルを読み込みました: {file_path}")
+        logger.debug("テキストファイルを読み込みました: %s", file_path)
         return content
 
     def load_json(self, file_path: Union[str, Path]) -> Any:
@@ -158,24 +207,25 @@ class StorageManager:
             読み込んだデータ
         """
         file_path = Path(file_path)
-        
-        if not file_path.exists():
+
+        try:
+            data = json_loader.load_file(file_path)
+        except FileNotFoundError:
             logger.warning(f"ファイルが存在しません: {file_path}")
             return {}
-            
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            
-        logger.debug(f"JSONファイルを読み込みました: {file_path}")
+
+        logger.debug("JSONファイルを読み込みました: %s", file_path)
         return data
 
-    def copy_file(self, src_path: Union[str, Path], dest_path: Union[str, Path]) -> Path:
+    def copy_file(self, src_path: Union[str, Path], dest_path: Union[str, Path],
+                  preserve_metadata: bool = False) -> Path:
         """
         ファイルをコピー
         
         Args:
             src_path: コピー元ファイルパス
             dest_path: コピー先ファイルパス
+            preserve_metadata: 更新日時などのメタデータもコピーするかどうか
             
         Returns:
             コピー先ファイルのパス
@@ -188,11 +238,14 @@ class StorageManager:
             raise FileNotFoundError(f"コピー元ファイルが存在しません: {src_path}")
             
         # ディレクトリが存在しない場合は作成
-        if not dest_path.parent.exists():
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
             
-        shutil.copy2(src_path, dest_path)
-        logger.debug(f"ファイルをコピーしました: {src_path} -> {dest_path}")
+        if preserve_metadata:
+            shutil.copy2(src_path, dest_path)
+        else:
+            # 内容のみコピー（Linuxではカーネル内でコピーされるため大きなファイルでも高速）
+            shutil.copyfile(src_path, dest_path)
+        logger.debug("ファイルをコピーしました: %s -> %s", src_path, dest_path)
         return dest_path
 
     def move_file(self, src_path: Union[str, Path], dest_path: Union[str, Path]) -> Path:
@@ -214,11 +267,10 @@ class StorageManager:
             raise FileNotFoundError(f"移動元ファイルが存在しません: {src_path}")
             
         # ディレクトリが存在しない場合は作成
-        if not dest_path.parent.exists():
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
             
         shutil.move(src_path, dest_path)
-        logger.debug(f"ファイルを移動しました: {src_path} -> {dest_path}")
+        logger.debug("ファイルを移動しました: %s -> %s", src_path, dest_path)
         return dest_path
 
     def delete_file(self, file_path: Union[str, Path]) -> bool:
@@ -238,7 +290,7 @@ class StorageManager:
             return False
             
         file_path.unlink()
-        logger.debug(f"ファイルを削除しました: {file_path}")
+        logger.debug("ファイルを削除しました: %s", file_path)
         return True
 
     def list_files(self, directory: Union[str, Path], pattern: str = "*") -> List[Path]:
@@ -253,13 +305,38 @@ class StorageManager:
             ファイルパスのリスト
         """
         directory = Path(directory)
-        
-        if not directory.exists():
+
+        # サブディレクトリを含むパターンはglobで処理
+        if "/" in pattern or os.sep in pattern or "**" in pattern:
+            if not directory.exists():
+                logger.warning(f"ディレクトリが存在しません: {directory}")
+                return []
+            return list(directory.glob(pattern))
+
+        try:
+            return [Path(entry.path) for entry in self.iter_files(directory, pattern)]
+        except (FileNotFoundError, NotADirectoryError):
             logger.warning(f"ディレクトリが存在しません: {directory}")
             return []
-            
-        files = list(directory.glob(pattern))
-        return files
+
+    def iter_files(self, directory: Union[str, Path], pattern: str = "*") -> Iterator[os.DirEntry]:
+        """
+        ディレクトリ直下のエントリのうち、ファイル名パターンに一致するものを順に取得
+
+        DirEntryはstat情報をキャッシュするため、呼び出し側で追加のシステムコールなしに
+        種類やサイズを確認できます。
+
+        Args:
+            directory: 対象ディレクトリ
+            pattern: ファイル名パターン（サブディレクトリを含まないもの）
+
+        Returns:
+            パターンに一致するエントリのイテレータ
+        """
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if fnmatch.fnmatch(entry.name, pattern):
+                    yield entry
 
     def create_temp_dir(self) -> Path:
         """
@@ -269,15 +346,13 @@ class StorageManager:
             作成した一時ディレクトリのパス
         """
         temp_base = Path(config_manager.get("temp_dir", "temp"))
-        if not temp_base.exists():
-            temp_base.mkdir(parents=True, exist_ok=True)
-            
+
         # タイムスタンプを含む一時ディレクトリ名
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         temp_dir = temp_base / f"temp_{timestamp}"
         temp_dir.mkdir(parents=True, exist_ok=True)
         
-        logger.debug(f"一時ディレクトリを作成しました: {temp_dir}")
+        logger.debug("一時ディレクトリを作成しました: %s", temp_dir)
         return temp_dir
 
     def cleanup_temp_dir(self, temp_dir: Union[str, Path]) -> None:
@@ -294,7 +369,7 @@ class StorageManager:
             return
             
         shutil.rmtree(temp_dir)
-        logger.debug(f"一時ディレクトリを削除しました: {temp_dir}")
+        logger.debug("一時ディレクトリを削除しました: %s", temp_dir)
 
 
 # シングルトンインスタンス
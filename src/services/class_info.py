@@ -3,16 +3,104 @@
 
 このモジュールは、ファイル名から日付・時間情報を抽出し、曜日と時限から授業情報（科目名、教員名）を取得するサービスを提供します。
 """
-import json
+import bisect
+import copy
 import re
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
+from ..infrastructure import json_loader
 from ..infrastructure.config import config_manager
 from ..infrastructure.logger import logger
 from ..infrastructure.storage import storage_manager
 
+# ファイル名から日付を抽出するパターン
+_DATE_YYYYMMDD_RE = re.compile(r"(\d{4})(\d{2})(\d{2})")
+_DATE_YYYY_MM_DD_RE = re.compile(r"(\d{4})[_\-](\d{2})[_\-](\d{2})")
+_DATE_JAPANESE_RE = re.compile(r"(\d{4})年(\d{1,2})月(\d{1,2})日")
+_DATE_MM_DD_RE = re.compile(r"(?<!\d)(\d{2})[_\-](\d{2})(?!\d)")
+
+# 上記のいずれかの形式に一致する最初の位置を1回の走査で求めるパターン
+# （共通の先頭2桁をくくり出して、日付を含まないファイル名を高速に判定する）
+_DATE_ANY_RE = re.compile(r"\d{2}(?:\d{6}|\d{2}[_\-]\d{2}[_\-]\d{2}|\d{2}年\d{1,2}月\d{1,2}日|[_\-]\d{2})")
+
+# 数字の有無を判定するパターン（日付・時限・時刻の形式はいずれも数字を含む）
+_DIGIT_RE = re.compile(r"\d")
+
+# ファイル名から時限を抽出するパターン
+_PERIOD_JAPANESE_RE = re.compile(r"(\d)限")
+_PERIOD_ENGLISH_RE = re.compile(r"period(\d)", re.IGNORECASE)
+_PERIOD_SHORT_RE = re.compile(r"p(\d)", re.IGNORECASE)
+
+# ファイル名から時刻を抽出するパターン
+# （YYYY-MM-DD HH-MM-SS形式のファイル名全体、または一般的な時間形式を1回の検索で判定）
+# 一般的な時間形式は、日付の一部（"2024-01-15" の "24-01" や "01-15"）に一致しないよう
+# 直前が数字でも「数字 + "-"/":"」でもなく、直後が数字でない 0:00～23:59 の範囲に限定する
+# （"lecture-10-45" のように数字以外に続く "-" の後の時刻は抽出する）
+_TIME_RE = re.compile(
+    r"^\d{4}-\d{2}-\d{2} (?P<dt_hour>\d{2})-(?P<dt_minute>\d{2})-\d{2}$"
+    r"|(?<!\d)(?<!\d[\-:])(?P<hour>[01]?\d|2[0-3])[:\-](?P<minute>[0-5]\d)(?!\d)"
+)
+
+# テスト用のデフォルト時間帯（(開始時刻), (終了時刻), 時限）
+_DEFAULT_TIME_PERIODS = (
+    ((8, 50), (10, 30), "1"),   # 1限: 8:50-10:30
+    ((10, 40), (12, 20), "2"),  # 2限: 10:40-12:20
+    ((13, 10), (14, 50), "3"),  # 3限: 13:10-14:50
+    ((15, 0), (16, 40), "4"),   # 4限: 15:00-16:40
+    ((16, 50), (18, 30), "5"),  # 5限: 16:50-18:30
+    ((18, 40), (20, 20), "6"),  # 6限: 18:40-20:20
+    ((20, 30), (22, 10), "7"),  # 7限: 20:30-22:10
+)
+
+# 授業情報の変換時に個別に扱うキー（それ以外のキーはそのままコピー）
+_CONVERTED_CLASS_INFO_KEYS = frozenset(("name", "teacher", "room", "notes"))
+
+# 曜日の名前（datetime.weekday() のインデックス順: 0:月曜, 1:火曜, ..., 6:日曜）
+_DAYS_OF_WEEK = ("月曜日", "火曜日", "水曜日", "木曜日", "金曜日", "土曜日", "日曜日")
+
+# ファイル名ごとの授業情報のキャッシュの最大件数
+_CLASS_INFO_CACHE_SIZE = 1024
+
+# 授業情報の検索で該当するエントリがない場合に使用する空のマッピング
+_EMPTY_MAPPING: Mapping = MappingProxyType({})
+
+# 読み込み済みの授業スケジュール（パス -> ((更新時刻, サイズ), スケジュール)）
+_SCHEDULE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+
+def _make_date_info(year: int, month: int, day: int, pattern: str) -> Optional[Dict]:
+    """
+    年月日から日付情報を作成
+
+    Args:
+        year: 年
+        month: 月
+        day: 日
+        pattern: 抽出に使用した日付の形式
+
+    Returns:
+        日付情報の辞書（日付、"YYYY-MM-DD"形式の文字列、形式）、無効な日付の場合はNone
+    """
+    # 明らかに範囲外の値は例外を発生させずに除外する
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    try:
+        date = datetime(year, month, day)
+    except ValueError:  # 2月30日など
+        return None
+    return {"date": date, "date_str": f"{year}-{month:02d}-{day:02d}", "pattern": pattern}
+
+
+def invalidate_schedule_cache() -> None:
+    """
+    読み込み済みの授業スケジュールのキャッシュを破棄
+    """
+    _SCHEDULE_CACHE.clear()
+
 
 class ClassInfoService:
     """授業情報サービスクラス"""
@@ -20,7 +108,48 @@ class ClassInfoService:
     def __init__(self):
         """初期化"""
         self.schedule_path = "config/schedule.json"
-        self.schedule = self._load_schedule()
+        # 授業スケジュールは最初に参照されたときに読み込む
+        self._schedule: Optional[Dict] = None
+        # ファイルに保存されていない変更があるかどうか
+        self._schedule_dirty = False
+        # MM-DD形式のファイル名の年として使用する現在の年（ファイル名ごとに現在時刻を取得しない）
+        self._current_year = datetime.now().year
+        # ファイル名ごとの授業情報（スケジュールが置き換えられたら破棄）
+        self._class_info_cache: Dict[str, Dict] = {}
+        self._class_info_cache_schedule: Optional[Dict] = None
+        # 複数のファイルを並列に処理する際にキャッシュの更新が競合しないようにするロック
+        self._class_info_cache_lock = threading.Lock()
+        # スケジュールから求めた時間帯と時限のマッピング（スケジュールが置き換えられたら破棄）
+        self._time_periods_cache: Optional[List] = None
+        self._time_periods_cache_schedule: Optional[Dict] = None
+        # 時間帯を分単位に変換した表（元の時間帯リスト, 開始時刻順の(開始, 終了, 時限), 開始時刻のリスト, 時間帯の重なりの有無）
+        self._period_ranges_cache: Optional[Tuple[List, Tuple[Tuple[int, int, str], ...], List[int], bool]] = None
+        # 授業情報の検索用テーブル（日付 -> 特別な授業情報、曜日 -> 時限ごとの授業情報）
+        self._special: Mapping[str, Dict] = _EMPTY_MAPPING
+        self._by_day: Dict[str, Dict] = {}
+        self._lookup_schedule: Optional[Dict] = None
+
+    @property
+    def schedule(self) -> Dict:
+        """
+        授業スケジュール（初回参照時に読み込む）
+
+        Returns:
+            授業スケジュール辞書
+        """
+        if self._schedule is None:
+            self._schedule = self._load_schedule()
+        return self._schedule
+
+    @schedule.setter
+    def schedule(self, schedule: Dict) -> None:
+        """
+        授業スケジュールを設定
+
+        Args:
+            schedule: 授業スケジュール辞書
+        """
+        self._schedule = schedule
 
     def _load_schedule(self) -> Dict:
         """
@@ -37,20 +166,26 @@ class ClassInfoService:
             default_schedule = self._create_default_schedule()
 
             # ディレクトリが存在しない場合は作成
-            if not schedule_path.parent.exists():
-                schedule_path.parent.mkdir(parents=True, exist_ok=True)
+            schedule_path.parent.mkdir(parents=True, exist_ok=True)
 
             # デフォルトスケジュールを保存
-            with open(schedule_path, "w", encoding="utf-8") as f:
-                json.dump(default_schedule, f, ensure_ascii=False, indent=2)
+            schedule_path.write_bytes(json_loader.dumps(default_schedule))
 
             logger.info(f"デフォルトの授業スケジュールを作成しました: {schedule_path}")
             return default_schedule
 
         try:
-            with open(schedule_path, "r", encoding="utf-8") as f:
-                schedule = json.load(f)
+            # ファイルが更新されていなければ前回の解析結果を再利用
+            stat = schedule_path.stat()
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            # （インスタンスごとの変更が他のインスタンスに影響しないよう、キャッシュとは別のコピーを返す）
+            cached = _SCHEDULE_CACHE.get(str(schedule_path))
+            if cached and cached[0] == cache_key:
+                return copy.deepcopy(cached[1])
+
+            schedule = json_loader.load_file(schedule_path)
 
+            _SCHEDULE_CACHE[str(schedule_path)] = (cache_key, copy.deepcopy(schedule))
             logger.info(f"授業スケジュールを読み込みました: {schedule_path}")
             return schedule
         except Exception as e:
@@ -64,16 +199,13 @@ class ClassInfoService:
         Returns:
             デフォルトの授業スケジュール辞書
         """
-        # 曜日
-        days = ["月曜日", "火曜日", "水曜日", "木曜日", "金曜日", "土曜日", "日曜日"]
-
         # 時限
         periods = ["1限", "2限", "3限", "4限", "5限", "6限", "7限"]
 
         # デフォルトスケジュール
         schedule = {}
 
-        for day in days:
+        for day in _DAYS_OF_WEEK:
             schedule[day] = {}
             for period in periods:
                 day_short = day[0]  # "月曜日" -> "月"
@@ -100,9 +232,35 @@ class ClassInfoService:
         Returns:
             授業情報の辞書
         """
-        file_path = Path(file_path)
-        filename = file_path.stem
+        filename = Path(file_path).stem
+
+        with self._class_info_cache_lock:
+            # 授業情報はファイル名とスケジュールだけで決まるため、同じファイル名の結果を再利用
+            if self._class_info_cache_schedule is not self.schedule:
+                self._class_info_cache.clear()
+                self._class_info_cache_schedule = self.schedule
+
+            # 最近参照したものを末尾に移動し、上限を超えたら最も古いものから破棄（LRU）
+            class_info = self._class_info_cache.pop(filename, None)
+            if class_info is None:
+                class_info = self._build_class_info_from_filename(filename)
+                if len(self._class_info_cache) >= _CLASS_INFO_CACHE_SIZE:
+                    del self._class_info_cache[next(iter(self._class_info_cache))]
+            self._class_info_cache[filename] = class_info
+
+        # 呼び出し側での変更がキャッシュに影響しないようコピーを返す
+        return dict(class_info)
+
+    def _build_class_info_from_filename(self, filename: str) -> Dict:
+        """
+        ファイル名（拡張子なし）から授業情報を作成
+
+        Args:
+            filename: ファイル名（拡張子なし）
 
+        Returns:
+            授業情報の辞書
+        """
         # 日付情報を抽出
         date_info = self._extract_date_from_filename(filename)
 
@@ -134,7 +292,7 @@ class ClassInfoService:
             }
 
         # 授業情報を取得
-        class_info = self._get_class_info(date, day_of_week, period)
+        class_info = self._get_class_info(date, day_of_week, period, date_info["date_str"])
 
         # 結果を返す
         return {
@@ -157,50 +315,41 @@ class ClassInfoService:
         Returns:
             日付情報の辞書、抽出できない場合はNone
         """
+        # いずれの形式も含まれない場合は個別の検索を行わない
+        any_match = _DATE_ANY_RE.search(filename)
+        if not any_match:
+            return None
+
+        # どの形式もこの位置より前には現れないため、ここから検索する
+        start = any_match.start()
+
         # パターン1: YYYYMMDD形式
-        pattern1 = r"(\d{4})(\d{2})(\d{2})"
-        match1 = re.search(pattern1, filename)
+        match1 = _DATE_YYYYMMDD_RE.search(filename, start)
         if match1:
-            year, month, day = map(int, match1.groups())
-            try:
-                date = datetime(year, month, day)
-                return {"date": date, "pattern": "YYYYMMDD"}
-            except ValueError:
-                pass
+            date_info = _make_date_info(*map(int, match1.groups()), "YYYYMMDD")
+            if date_info:
+                return date_info
 
         # パターン2: YYYY-MM-DD形式
-        pattern2 = r"(\d{4})[_\-](\d{2})[_\-](\d{2})"
-        match2 = re.search(pattern2, filename)
+        match2 = _DATE_YYYY_MM_DD_RE.search(filename, start)
         if match2:
-            year, month, day = map(int, match2.groups())
-            try:
-                date = datetime(year, month, day)
-                return {"date": date, "pattern": "YYYY-MM-DD"}
-            except ValueError:
-                pass
+            date_info = _make_date_info(*map(int, match2.groups()), "YYYY-MM-DD")
+            if date_info:
+                return date_info
 
         # パターン3: YYYY年MM月DD日形式
-        pattern3 = r"(\d{4})年(\d{1,2})月(\d{1,2})日"
-        match3 = re.search(pattern3, filename)
+        match3 = _DATE_JAPANESE_RE.search(filename, start)
         if match3:
-            year, month, day = map(int, match3.groups())
-            try:
-                date = datetime(year, month, day)
-                return {"date": date, "pattern": "YYYY年MM月DD日"}
-            except ValueError:
-                pass
+            date_info = _make_date_info(*map(int, match3.groups()), "YYYY年MM月DD日")
+            if date_info:
+                return date_info
 
         # パターン4: MM-DD形式（年は現在の年と仮定）
-        pattern4 = r"(\d{2})[_\-](\d{2})"
-        match4 = re.search(pattern4, filename)
+        match4 = _DATE_MM_DD_RE.search(filename, start)
         if match4:
-            month, day = map(int, match4.groups())
-            try:
-                current_year = datetime.now().year
-                date = datetime(current_year, month, day)
-                return {"date": date, "pattern": "MM-DD"}
-            except ValueError:
-                pass
+            date_info = _make_date_info(self._current_year, *map(int, match4.groups()), "MM-DD")
+            if date_info:
+                return date_info
 
         # 日付情報が見つからない場合
         return None
@@ -215,37 +364,34 @@ class ClassInfoService:
         Returns:
             時限情報、抽出できない場合はNone
         """
+        # いずれの形式も数字を含むため、数字がなければ個別の検索を行わない
+        if not _DIGIT_RE.search(filename):
+            return None
+
         # パターン1: N限形式
-        pattern1 = r"(\d)限"
-        match1 = re.search(pattern1, filename)
+        match1 = _PERIOD_JAPANESE_RE.search(filename)
         if match1:
             return match1.group(1)
 
         # パターン2: periodN形式
-        pattern2 = r"period(\d)"
-        match2 = re.search(pattern2, filename, re.IGNORECASE)
+        match2 = _PERIOD_ENGLISH_RE.search(filename)
         if match2:
             return match2.group(1)
 
         # パターン3: pN形式
-        pattern3 = r"p(\d)"
-        match3 = re.search(pattern3, filename, re.IGNORECASE)
+        match3 = _PERIOD_SHORT_RE.search(filename)
         if match3:
             return match3.group(1)
 
         # パターン4: YYYY-MM-DD HH-MM-SS形式
-        datetime_pattern = r"^\d{4}-\d{2}-\d{2} (\d{2})-(\d{2})-\d{2}$"
-        datetime_match = re.search(datetime_pattern, filename)
-        if datetime_match:
-            hour, minute = map(int, datetime_match.groups())
-            return self._estimate_period_from_time(hour, minute)
-
         # パターン5: 一般的な時間形式
-        time_pattern = r"(\d{2})[:\-](\d{2})"
-        time_match = re.search(time_pattern, filename)
+        time_match = _TIME_RE.search(filename)
         if time_match:
-            hour, minute = map(int, time_match.groups())
-            return self._estimate_period_from_time(hour, minute)
+            if time_match.group("dt_hour") is not None:
+                hour, minute = time_match.group("dt_hour", "dt_minute")
+            else:
+                hour, minute = time_match.group("hour", "minute")
+            return self._estimate_period_from_time(int(hour), int(minute))
 
         # 時限情報が見つからない場合
         return None
@@ -257,19 +403,24 @@ class ClassInfoService:
         Returns:
             時間帯と時限のマッピングのリスト
         """
-        # テスト用のデフォルト時間帯
-        default_time_periods = [
-            ((8, 50), (10, 30), "1"),   # 1限: 8:50-10:30
-            ((10, 40), (12, 20), "2"),  # 2限: 10:40-12:20
-            ((13, 10), (14, 50), "3"),  # 3限: 13:10-14:50
-            ((15, 0), (16, 40), "4"),   # 4限: 15:00-16:40
-            ((16, 50), (18, 30), "5"),  # 5限: 16:50-18:30
-            ((18, 40), (20, 20), "6"),  # 6限: 18:40-20:20
-            ((20, 30), (22, 10), "7"),  # 7限: 20:30-22:10
-        ]
+        # スケジュールが変わっていなければ前回の結果を再利用
+        if self._time_periods_cache is not None and self._time_periods_cache_schedule is self.schedule:
+            return self._time_periods_cache
+
+        time_periods = self._build_time_periods_from_schedule()
+        self._time_periods_cache = time_periods
+        self._time_periods_cache_schedule = self.schedule
+        return time_periods
+
+    def _build_time_periods_from_schedule(self) -> list:
+        """
+        スケジュールを走査して時間帯と時限のマッピングを作成
 
-        # スケジュールから時間帯を抽出
-        time_periods = []
+        Returns:
+            時間帯と時限のマッピングのリスト
+        """
+        # スケジュールから時間帯を抽出（時限番号 -> 時間帯）
+        time_periods = {}
 
         # 全ての曜日のスケジュールから時間情報を抽出
         for day, periods in self.schedule.items():
@@ -281,6 +432,10 @@ class ClassInfoService:
                 # 時限番号を抽出（例: "1限" -> "1"）
                 period_num = period_name[0]
 
+                # 重複を避けるため、既に同じ時限が登録されていればスキップ
+                if period_num in time_periods:
+                    continue
+
                 # 開始時間と終了時間を取得
                 start_time = class_info.get("start_time", "")
                 end_time = class_info.get("end_time", "")
@@ -295,41 +450,57 @@ class ClassInfoService:
                     end_hour, end_min = map(int, end_time.split(":"))
 
                     # 時間帯と時限のタプルを追加
-                    time_period = ((start_hour, start_min), (end_hour, end_min), period_num)
-
-                    # 重複を避けるため、既に同じ時限がリストにあるかチェック
-                    if not any(p[2] == period_num for p in time_periods):
-                        time_periods.append(time_period)
+                    time_periods[period_num] = ((start_hour, start_min), (end_hour, end_min), period_num)
                 except (ValueError, IndexError):
                     # 時間のパースに失敗した場合はスキップ
                     continue
 
         # 時間帯が見つからない場合はデフォルト値を使用
         if not time_periods:
-            return default_time_periods
-
-        # 時限番号でソート
-        time_periods.sort(key=lambda x: int(x[2]))
+            return list(_DEFAULT_TIME_PERIODS)
 
         # テストケースとの互換性のために、デフォルト値と実際の値をマージ
         # 同じ時限番号のものはデフォルト値を優先
-        merged_periods = default_time_periods.copy()
+        merged_periods = {period[2]: period for period in _DEFAULT_TIME_PERIODS}
 
         # スケジュールから抽出した時間帯で、デフォルト値にない時限番号のものを追加
-        for period in time_periods:
-            period_num = period[2]
-            if not any(p[2] == period_num for p in merged_periods):
-                merged_periods.append(period)
+        for period_num, period in time_periods.items():
+            merged_periods.setdefault(period_num, period)
 
         # 時限番号でソート
-        merged_periods.sort(key=lambda x: int(x[2]))
+        return sorted(merged_periods.values(), key=lambda x: int(x[2]))
+
+    def _get_period_ranges(self) -> Tuple[Tuple[Tuple[int, int, str], ...], List[int], bool]:
+        """
+        時間帯を分単位に変換し、開始時刻順に並べた表を取得
+
+        Returns:
+            (開始時刻(分), 終了時刻(分), 時限)のタプル、開始時刻(分)のリスト、
+            重なっている時間帯があるかどうか
+        """
+        time_periods = self._get_time_periods_from_schedule()
 
-        return merged_periods
+        # 時間帯のリストが再計算された場合のみ表を作り直す
+        cache = self._period_ranges_cache
+        if cache is None or cache[0] is not time_periods:
+            ranges = tuple(sorted(
+                (start_hour * 60 + start_min, end_hour * 60 + end_min, period)
+                for (start_hour, start_min), (end_hour, end_min), period in time_periods
+            ))
+            starts = [start_time for start_time, _, _ in ranges]
+            overlapping = any(current[0] <= previous[1] for previous, current in zip(ranges, ranges[1:]))
+            cache = (time_periods, ranges, starts, overlapping)
+            self._period_ranges_cache = cache
+
+        return cache[1], cache[2], cache[3]
 
     def _estimate_period_from_time(self, hour: int, minute: int) -> str:
         """
         時間から時限を推定
 
+        時刻を含む時間帯があればその時限（複数ある場合は時限番号の小さい方）を、
+        なければ最も近い時間帯の時限を返します。
+
         Args:
             hour: 時
             minute: 分
@@ -340,53 +511,82 @@ class ClassInfoService:
         Raises:
             ValueError: 設定にない時間が指定された場合
         """
-        # スケジュールから時間帯と時限のマッピングを取得
-        time_periods = self._get_time_periods_from_schedule()
+        # 各時限の時間帯（分単位、開始時刻順）を取得
+        ranges, starts, overlapping = self._get_period_ranges()
 
         # 時間を分に変換
         time_in_minutes = hour * 60 + minute
 
-        # 各時限の時間帯と比較
-        for (start_hour, start_min), (end_hour, end_min), period in time_periods:
-            start_time = start_hour * 60 + start_min
-            end_time = end_hour * 60 + end_min
+        if overlapping:
+            # ユーザー設定で時間帯が重なっている場合は、二分探索では時限番号順の判定にならないため
+            # 時限番号順に全件を比較する
+            min_distance, closest_period = self._find_period_linear(time_in_minutes)
+        else:
+            min_distance, closest_period = self._find_period_bisect(time_in_minutes, ranges, starts)
 
-            if start_time <= time_in_minutes <= end_time:
-                return period
+        # 最も近い時限までの距離が大きすぎる場合（例: 3時間以上）はエラーとする
+        if min_distance > 180:  # 3時間 = 180分
+            time_str = f"{hour:02d}:{minute:02d}"
+            logger.error(f"設定にない時間が指定されました: {time_str}")
+            raise ValueError(f"JSONに設定されていない時間が指定されました: {time_str}")
 
-        # 該当する時限がない場合は最も近い時限を返す
-        closest_period = "1"
-        min_distance = float('inf')
+        return closest_period
 
-        # 各時限との距離を計算
-        period_distances = []
-        for (start_hour, start_min), (end_hour, end_min), period in time_periods:
-            start_time = start_hour * 60 + start_min
-            end_time = end_hour * 60 + end_min
+    @staticmethod
+    def _find_period_bisect(time_in_minutes: int, ranges: Tuple[Tuple[int, int, str], ...],
+                            starts: List[int]) -> Tuple[int, str]:
+        """
+        重なりのない時間帯の表から、時刻を含むまたは最も近い時限を二分探索で求める
 
-            # 開始時刻までの距離
-            distance_to_start = abs(time_in_minutes - start_time)
-            # 終了時刻までの距離
-            distance_to_end = abs(time_in_minutes - end_time)
-            # 最小距離を取得
-            distance = min(distance_to_start, distance_to_end)
+        Args:
+            time_in_minutes: 時刻（分）
+            ranges: 開始時刻順の(開始時刻(分), 終了時刻(分), 時限)
+            starts: 開始時刻(分)のリスト
 
-            period_distances.append((distance, period, start_time))
+        Returns:
+            (時間帯までの距離(分), 時限)。時間帯に含まれる場合の距離は0
+        """
+        # 開始時刻が指定時刻以前である最後の時限を二分探索で求める
+        index = bisect.bisect_right(starts, time_in_minutes)
+        before = ranges[index - 1] if index > 0 else None
+        after = ranges[index] if index < len(ranges) else None
+
+        # その時限の時間帯に含まれていればその時限を返す
+        if before is not None and time_in_minutes <= before[1]:
+            return 0, before[2]
+
+        # 該当する時限がない場合は前後の時限のうち近い方を返す
+        # 同じ距離の場合は開始時間が遅い方（後の時限）を優先
+        if after is not None and (before is None or after[0] - time_in_minutes <= time_in_minutes - before[1]):
+            return after[0] - time_in_minutes, after[2]
+        return time_in_minutes - before[1], before[2]
+
+    def _find_period_linear(self, time_in_minutes: int) -> Tuple[int, str]:
+        """
+        時間帯を時限番号順に比較し、時刻を含むまたは最も近い時限を求める
 
-        # 距離でソートし、同じ距離の場合は開始時間が遅い方（後の時限）を優先
-        period_distances.sort(key=lambda x: (x[0], -x[2]))
+        Args:
+            time_in_minutes: 時刻（分）
 
-        # 最も近い時限を返す
-        closest_period = period_distances[0][1]
+        Returns:
+            (時間帯までの距離(分), 時限)。時間帯に含まれる場合の距離は0
+        """
+        periods = [
+            (start_hour * 60 + start_min, end_hour * 60 + end_min, period)
+            for (start_hour, start_min), (end_hour, end_min), period in self._get_time_periods_from_schedule()
+        ]
 
-        # 最も近い時限までの距離が大きすぎる場合（例: 3時間以上）はエラーとする
-        min_distance = period_distances[0][0]
-        if min_distance > 180:  # 3時間 = 180分
-            time_str = f"{hour:02d}:{minute:02d}"
-            logger.error(f"設定にない時間が指定されました: {time_str}")
-            raise ValueError(f"JSONに設定されていない時間が指定されました: {time_str}")
+        # 時刻を含む最初の時限
+        for start_time, end_time, period in periods:
+            if start_time <= time_in_minutes <= end_time:
+                return 0, period
 
-        return closest_period
+        # 最も近い時限（同じ距離の場合は開始時間が遅い方、それも同じ場合は時限番号順で先の方）
+        distance, _, _, period = min(
+            (min(abs(time_in_minutes - start_time), abs(time_in_minutes - end_time)), -start_time, order, period)
+            for order, (start_time, end_time, period) in enumerate(periods)
+        )
+        return distance, period
 
     def _get_day_of_week(self, date: datetime) -> str:
         """
@@ -398,15 +598,10 @@ class ClassInfoService:
         Returns:
             曜日（"月曜日", "火曜日", "水曜日", "木曜日", "金曜日", "土曜日", "日曜日"）
         """
-        # 曜日のマッピング
-        days = ["月曜日", "火曜日", "水曜日", "木曜日", "金曜日", "土曜日", "日曜日"]
-
-        # 日付から曜日のインデックスを取得（0:月曜, 1:火曜, ..., 6:日曜）
-        weekday = date.weekday()
-
-        return days[weekday]
+        return _DAYS_OF_WEEK[date.weekday()]
 
-    def _get_class_info(self, date: datetime, day_of_week: str, period: str) -> Dict:
+    def _get_class_info(self, date: datetime, day_of_week: str, period: str,
+                        date_str: Optional[str] = None) -> Dict:
         """
         日付、曜日、時限から授業情報を取得
 
@@ -414,27 +609,28 @@ class ClassInfoService:
             date: 日付
             day_of_week: 曜日
             period: 時限
+            date_str: "YYYY-MM-DD"形式の日付文字列（省略時は date から作成）
 
         Returns:
             授業情報の辞書
         """
         # 日付文字列
-        date_str = date.strftime("%Y-%m-%d")
+        if date_str is None:
+            date_str = date.strftime("%Y-%m-%d")
 
         # 時限を新しいフォーマットに変換
         period_new = f"{period}限"
 
-        # 特別な授業情報があるか確認
-        if "special" in self.schedule and date_str in self.schedule["special"]:
-            special_info = self.schedule["special"][date_str]
+        # スケジュールが置き換えられていれば検索用テーブルを作り直す
+        if self._lookup_schedule is not self.schedule:
+            self._build_lookup_tables()
 
-            # 特定の時限の情報があるか確認
-            if period_new in special_info:
-                return self._convert_class_info_format(special_info[period_new])
-
-        # 通常の授業情報を取得
-        if day_of_week in self.schedule and period_new in self.schedule[day_of_week]:
-            return self._convert_class_info_format(self.schedule[day_of_week][period_new])
+        # 特別な授業情報（特定の日付・時限）を優先し、なければ通常の授業情報を取得
+        class_info = self._special.get(date_str, _EMPTY_MAPPING).get(period_new)
+        if class_info is None:
+            class_info = self._by_day.get(day_of_week, _EMPTY_MAPPING).get(period_new)
+        if class_info is not None:
+            return self._convert_class_info_format(class_info)
 
         # 該当する授業情報がない場合
         return {
@@ -444,6 +640,14 @@ class ClassInfoService:
             "notes": ""
         }
 
+    def _build_lookup_tables(self) -> None:
+        """
+        現在のスケジュールから授業情報の検索用テーブルを作成
+        """
+        self._special = self.schedule.get("special") or _EMPTY_MAPPING
+        self._by_day = {day: self.schedule[day] for day in _DAYS_OF_WEEK if day in self.schedule}
+        self._lookup_schedule = self.schedule
+
     def update_schedule(self, schedule: Dict) -> bool:
         """
         授業スケジュールを更新
@@ -456,17 +660,21 @@ class ClassInfoService:
         """
         try:
             # スケジュールを更新
+            # （同じスケジュールを変更して渡された場合も古い授業情報を返さないよう、キャッシュは常に破棄）
             self.schedule = schedule
+            with self._class_info_cache_lock:
+                self._class_info_cache.clear()
+            self._time_periods_cache = None
+            self._lookup_schedule = None
 
             # ファイルに保存
             schedule_path = Path(self.schedule_path)
 
             # ディレクトリが存在しない場合は作成
-            if not schedule_path.parent.exists():
-                schedule_path.parent.mkdir(parents=True, exist_ok=True)
+            schedule_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(schedule_path, "w", encoding="utf-8") as f:
-                json.dump(schedule, f, ensure_ascii=False, indent=2)
+            schedule_path.write_bytes(json_loader.dumps(schedule))
+            self._schedule_dirty = False
 
             logger.info(f"授業スケジュールを更新しました: {schedule_path}")
             return True
@@ -474,14 +682,19 @@ class ClassInfoService:
             logger.error(f"授業スケジュールの更新に失敗しました: {e}")
             return False
 
-    def add_special_class(self, date: Union[datetime, str], period: str, class_info: Dict) -> bool:
+    def add_special_class(self, date: Union[datetime, str], period: str, class_info: Dict,
+                          commit: bool = True) -> bool:
         """
         特別な授業情報を追加
 
+        複数の授業情報をまとめて追加する場合は commit=False を指定し、
+        最後に flush() を呼び出すとファイルへの書き込みが1回で済みます。
+
         Args:
             date: 日付（datetime型または"YYYY-MM-DD"形式の文字列）
             period: 時限
             class_info: 授業情報
+            commit: ファイルにすぐ保存するかどうか
 
         Returns:
             追加に成功した場合はTrue、それ以外はFalse
@@ -493,21 +706,19 @@ class ClassInfoService:
             else:
                 date_str = date
 
-            # 特別な授業情報がない場合は初期化
-            if "special" not in self.schedule:
-                self.schedule["special"] = {}
-
-            # 日付の特別情報がない場合は初期化
-            if date_str not in self.schedule["special"]:
-                self.schedule["special"][date_str] = {}
+            # 授業情報を追加（特別な授業情報・日付の特別情報がない場合は初期化）
+            self.schedule.setdefault("special", {}).setdefault(date_str, {})[period] = class_info
+            with self._class_info_cache_lock:
+                self._class_info_cache.clear()
+            self._time_periods_cache = None
+            self._lookup_schedule = None
 
-            # 授業情報を追加
-            self.schedule["special"][date_str][period] = class_info
-
-            # ファイルに保存
-            schedule_path = Path(self.schedule_path)
-            with open(schedule_path, "w", encoding="utf-8") as f:
-                json.dump(self.schedule, f, ensure_ascii=False, indent=2)
+            if commit:
+                # ファイルに保存
+                self._write_schedule()
+            else:
+                # flush() で保存するまでメモリ上でのみ変更
+                self._schedule_dirty = True
 
             logger.info(f"特別な授業情報を追加しました: {date_str} {period}限")
             return True
@@ -515,6 +726,31 @@ class ClassInfoService:
             logger.error(f"特別な授業情報の追加に失敗しました: {e}")
             return False
 
+    def flush(self) -> bool:
+        """
+        保存されていない授業スケジュールの変更をファイルに書き込む
+
+        Returns:
+            書き込みに成功した場合（変更がない場合を含む）はTrue、それ以外はFalse
+        """
+        if not self._schedule_dirty:
+            return True
+
+        try:
+            self._write_schedule()
+            logger.info(f"授業スケジュールを保存しました: {self.schedule_path}")
+            return True
+        except Exception as e:
+            logger.error(f"授業スケジュールの保存に失敗しました: {e}")
+            return False
+
+    def _write_schedule(self) -> None:
+        """
+        現在の授業スケジュールをファイルに書き込む
+        """
+        Path(self.schedule_path).write_bytes(json_loader.dumps(self.schedule))
+        self._schedule_dirty = False
+
     def _convert_class_info_format(self, class_info: Dict) -> Dict:
         """
         新しいフォーマットの授業情報を古いフォーマットに変換
@@ -541,7 +777,7 @@ class ClassInfoService:
 
         # その他の情報もコピー
         for key, value in class_info.items():
-            if key not in ["name", "teacher", "room", "notes"]:
+            if key not in _CONVERTED_CLASS_INFO_KEYS:
                 result[key] = value
 
         return result
@@ -4,6 +4,8 @@
 このモジュールは、文字起こし結果のハルシネーション（幻覚）をチェックし、
 信頼性を評価するサービスを提供します。
 """
+import re
+import threading
 import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
@@ -34,6 +36,7 @@ class HallucinationService:
         # レート制限のための変数
         self.requests_per_minute = config_manager.get("hallucination.requests_per_minute", 5)  # デフォルトは1分あたり5リクエスト
         self.request_timestamps = []  # リクエストのタイムスタンプを記録するリスト
+        self._rate_limit_lock = threading.Lock()  # レート制限チェック用のロック
 
     def check_hallucination(self, media_file: MediaFile, 
                            transcription_result: TranscriptionResult) -> TranscriptionResult:
@@ -176,7 +179,7 @@ class HallucinationService:
             logger.warning(f"プロンプトファイルが見つかりません: {self.prompt_path}")
             return "音声ファイルと文字起こし結果を比較し、ハルシネーション（幻覚）がないか確認してください。"
 
-        return storage_manager.load_text(self.prompt_path)
+        return storage_manager.load_text(self.prompt_path, cache=True)
 
     def _format_segments_for_check(self, segments: List[TranscriptionSegment]) -> str:
         """
@@ -235,7 +238,6 @@ class HallucinationService:
             # RESOURCE_EXHAUSTEDエラーかどうかを確認
             if "RESOURCE_EXHAUSTED" in error_str:
                 # retryDelayを抽出
-                import re
                 retry_delay_match = re.search(r"'retryDelay': '(\d+)s'", error_str)
                 if retry_delay_match:
                     return float(retry_delay_match.group(1))
@@ -297,11 +299,11 @@ class HallucinationService:
         retry_count = 0
         while retry_count <= self.max_retries:
             try:
-                # レート制限をチェック
-                self._check_rate_limit()
-
-                # リクエストのタイムスタンプを記録
-                self.request_timestamps.append(time.time())
+                # レート制限をチェックし、リクエストのタイムスタンプを記録
+                # （複数ファイルの並列処理時にタイムスタンプが競合しないようロックで保護）
+                with self._rate_limit_lock:
+                    self._check_rate_limit()
+                    self.request_timestamps.append(time.time())
 
                 # 音声ファイルをアップロード
                 my_file = client.files.upload(file=str(file_path))
@@ -525,7 +527,7 @@ class HallucinationService:
 
         # 要約
         total_segments = len(result.segments)
-        hallucination_count = sum(1 for h in result.hallucination_results if h.severity != HallucinationSeverity.NONE)
+        hallucination_count = sum(1 for h in result.hallucination_results if h.severity is not HallucinationSeverity.NONE)
 
         lines.append(f"## 要約")
         lines.append(f"- 総セグメント数: {total_segments}")
@@ -554,7 +556,7 @@ class HallucinationService:
         lines.append(f"## 詳細結果")
 
         for i, hallucination in enumerate(result.hallucination_results):
-            if hallucination.severity == HallucinationSeverity.NONE:
+            if hallucination.severity is HallucinationSeverity.NONE:
                 continue
 
             segment = hallucination.segment
@@ -4,6 +4,8 @@
 このモジュールは、音声・動画ファイルの処理に関するサービスを提供します。
 """
 import os
+import re
+import subprocess
 import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
@@ -64,6 +66,37 @@ class MediaProcessorService:
         logger.info(f"メディアファイルを処理しました: {file_path} (タイプ: {media_type.name}, 長さ: {duration:.2f}秒)")
         return media_file
 
+    def process_audio_file(self, file_path: Union[str, Path]) -> MediaFile:
+        """
+        音声ファイルを処理
+
+        拡張子から音声ファイルと分かっている場合に使用します。
+        メディアタイプの判定や動画の品質判定を行わず、長さのみを取得します。
+
+        Args:
+            file_path: 音声ファイルのパス
+
+        Returns:
+            処理されたMediaFileオブジェクト
+        """
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            logger.error(f"ファイルが存在しません: {file_path}")
+            raise FileNotFoundError(f"ファイルが存在しません: {file_path}")
+
+        # 長さを取得
+        duration = ffmpeg_wrapper.get_duration(file_path)
+
+        media_file = MediaFile(
+            file_path=file_path,
+            media_type=MediaType.AUDIO,
+            duration=duration
+        )
+
+        logger.info(f"音声ファイルを処理しました: {file_path} (長さ: {duration:.2f}秒)")
+        return media_file
+
     def _determine_media_type(self, file_path: Path) -> MediaType:
         """
         ファイルのメディアタイプを判定
@@ -132,9 +165,9 @@ class MediaProcessorService:
             return media_file
 
         # 出力ディレクトリを生成
-        output_dir = self.temp_dir / f"{media_file.file_path.stem}_chunks"
-        if not output_dir.exists():
-            output_dir.mkdir(parents=True, exist_ok=True)
+        # （同じ名前のファイルを並列に処理してもチャンクが混ざらないよう、ファイルごとに一意のディレクトリを作成）
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = Path(tempfile.mkdtemp(prefix=f"{media_file.file_path.stem}_chunks_", dir=self.temp_dir))
 
         # ファイルを分割（設定から取得したチャンク長を使用）
         logger.info(f"メディアファイルを分割します: {media_file.file_path} (チャンク長: {chunk_duration}秒)")
@@ -290,7 +323,6 @@ class MediaProcessorService:
                 "-"
             ]
 
-            import subprocess
             result = subprocess.run(
                 cmd,
                 stdout=subprocess.PIPE,
@@ -301,7 +333,6 @@ class MediaProcessorService:
             )
 
             # 出力からタイムスタンプを抽出
-            import re
             timestamps = []
             last_timestamp = 0.0
 
@@ -3,6 +3,8 @@
 
 このモジュールは、文字起こし結果から構造化された議事録を生成するサービスを提供します。
 """
+import re
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -34,6 +36,7 @@ class MinutesGeneratorService:
         # レート制限のための変数
         self.requests_per_minute = config_manager.get("minutes.requests_per_minute", 5)  # デフォルトは1分あたり5リクエスト
         self.request_timestamps = []  # リクエストのタイムスタンプを記録するリスト
+        self._rate_limit_lock = threading.Lock()  # レート制限チェック用のロック
 
     def generate_minutes(self, transcription_result: TranscriptionResult, 
                         media_file: MediaFile, 
@@ -164,7 +167,7 @@ class MinutesGeneratorService:
             logger.warning(f"プロンプトファイルが見つかりません: {self.prompt_path}")
             return "文字起こし結果から議事録を生成してください。要約、重要ポイント、タスク、用語集を含めてください。"
 
-        return storage_manager.load_text(self.prompt_path)
+        return storage_manager.load_text(self.prompt_path, cache=True)
 
     def _extract_retry_delay_from_error(self, error) -> float:
         """
@@ -183,7 +186,6 @@ class MinutesGeneratorService:
             # RESOURCE_EXHAUSTEDエラーかどうかを確認
             if "RESOURCE_EXHAUSTED" in error_str:
                 # retryDelayを抽出
-                import re
                 retry_delay_match = re.search(r"'retryDelay': '(\d+)s'", error_str)
                 if retry_delay_match:
                     return float(retry_delay_match.group(1))
@@ -238,11 +240,11 @@ class MinutesGeneratorService:
         retry_count = 0
         while retry_count <= self.max_retries:
             try:
-                # レート制限をチェック
-                self._check_rate_limit()
-
-                # リクエストのタイムスタンプを記録
-                self.request_timestamps.append(time.time())
+                # レート制限をチェックし、リクエストのタイムスタンプを記録
+                # （複数ファイルの並列処理時にタイムスタンプが競合しないようロックで保護）
+                with self._rate_limit_lock:
+                    self._check_rate_limit()
+                    self.request_timestamps.append(time.time())
 
                 # コンテンツの準備
                 contents = [
@@ -606,7 +608,7 @@ class MinutesGeneratorService:
             logger.warning(f"プロンプトファイルが見つかりません: {self.summary_prompt_path}")
             return "文字起こし結果を簡潔に要約してください。"
 
-        return storage_manager.load_text(self.summary_prompt_path)
+        return storage_manager.load_text(self.summary_prompt_path, cache=True)
 
     def _generate_summary_with_gemini(self, transcription_result: TranscriptionResult, prompt: str) -> str:
         """
@@ -638,11 +640,11 @@ class MinutesGeneratorService:
         retry_count = 0
         while retry_count <= self.max_retries:
             try:
-                # レート制限をチェック
-                self._check_rate_limit()
-
-                # リクエストのタイムスタンプを記録
-                self.request_timestamps.append(time.time())
+                # レート制限をチェックし、リクエストのタイムスタンプを記録
+                # （複数ファイルの並列処理時にタイムスタンプが競合しないようロックで保護）
+                with self._rate_limit_lock:
+                    self._check_rate_limit()
+                    self.request_timestamps.append(time.time())
 
                 # コンテンツの準備
                 contents = [
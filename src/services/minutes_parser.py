@@ -5,13 +5,24 @@
 """
 import re
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from ..domain.minutes import (
     GlossaryItem, Minutes, MinutesHeading, MinutesSection, MinutesTask
 )
 from ..infrastructure.logger import logger
 
+# セクション（## で始まる行をセクションの開始とみなす）
+_SECTION_RE = re.compile(r"## ([^\n]+)\n(.*?)(?=\n## |$)", re.DOTALL)
+# 見出し（#で始まる行）
+_HEADING_RE = re.compile(r"(#{1,6}) ([^\n]+)")
+# タスク（- で始まる行）と担当者・期限
+_TASK_RE = re.compile(r"- ([^\n]+)")
+_ASSIGNEE_RE = re.compile(r"担当: ([^,\.]+)")
+_DUE_DATE_RE = re.compile(r"期限: (\d{4}-\d{2}-\d{2})")
+# 用語（- 用語: 説明）
+_GLOSSARY_RE = re.compile(r"- ([^:]+): ([^\n]+)")
+
 
 class MinutesParserService:
     """議事録パーサーサービスクラス"""
@@ -48,12 +59,12 @@ class MinutesParserService:
             minutes.add_heading(heading)
 
         # タスク・宿題を抽出して設定
-        tasks = self._extract_tasks(content)
+        tasks = self._extract_tasks(content, sections)
         for task in tasks:
             minutes.add_task(task)
 
         # 用語集を抽出して設定
-        glossary_items = self._extract_glossary(content)
+        glossary_items = self._extract_glossary(content, sections)
         for item in glossary_items:
             minutes.add_glossary_item(item)
 
@@ -72,8 +83,7 @@ class MinutesParserService:
         sections = {}
 
         # セクションを抽出（## で始まる行をセクションの開始とみなす）
-        section_pattern = r"## ([^\n]+)\n(.*?)(?=\n## |$)"
-        matches = re.findall(section_pattern, content, re.DOTALL)
+        matches = _SECTION_RE.findall(content)
 
         for section_name, section_content in matches:
             sections[section_name.strip()] = section_content.strip()
@@ -93,8 +103,7 @@ class MinutesParserService:
         headings = []
 
         # 見出しを抽出（#で始まる行）
-        heading_pattern = r"(#{1,6}) ([^\n]+)"
-        matches = re.findall(heading_pattern, content)
+        matches = _HEADING_RE.findall(content)
 
         for hashes, text in matches:
             level = len(hashes)
@@ -106,12 +115,13 @@ class MinutesParserService:
 
         return headings
 
-    def _extract_tasks(self, content: str) -> List[MinutesTask]:
+    def _extract_tasks(self, content: str, sections: Optional[Dict[str, str]] = None) -> List[MinutesTask]:
         """
         議事録内容からタスク・宿題を抽出
 
         Args:
             content: 議事録内容
+            sections: 抽出済みのセクション（省略時は content から抽出）
 
         Returns:
             タスク・宿題のリスト
@@ -119,26 +129,24 @@ class MinutesParserService:
         tasks = []
 
         # タスクセクションを探す
-        task_section_pattern = r"## タスク・宿題\n(.*?)(?=\n## |$)"
-        task_section_match = re.search(task_section_pattern, content, re.DOTALL)
-
-        if task_section_match:
-            task_section = task_section_match.group(1)
+        if sections is None:
+            sections = self._extract_sections(content)
+        task_section = sections.get("タスク・宿題")
 
+        if task_section:
             # タスクを抽出（- で始まる行）
-            task_pattern = r"- ([^\n]+)"
-            task_matches = re.findall(task_pattern, task_section)
+            task_matches = _TASK_RE.findall(task_section)
 
             for task_text in task_matches:
                 # 担当者と期限を抽出
                 assignee = None
                 due_date = None
 
-                assignee_match = re.search(r"担当: ([^,\.]+)", task_text)
+                assignee_match = _ASSIGNEE_RE.search(task_text)
                 if assignee_match:
                     assignee = assignee_match.group(1).strip()
 
-                due_date_match = re.search(r"期限: (\d{4}-\d{2}-\d{2})", task_text)
+                due_date_match = _DUE_DATE_RE.search(task_text)
                 if due_date_match:
                     due_date_str = due_date_match.group(1)
                     try:
@@ -155,12 +163,13 @@ class MinutesParserService:
 
         return tasks
 
-    def _extract_glossary(self, content: str) -> List[GlossaryItem]:
+    def _extract_glossary(self, content: str, sections: Optional[Dict[str, str]] = None) -> List[GlossaryItem]:
         """
         議事録内容から用語集を抽出
 
         Args:
             content: 議事録内容
+            sections: 抽出済みのセクション（省略時は content から抽出）
 
         Returns:
             用語集のリスト
@@ -168,15 +177,13 @@ class MinutesParserService:
         glossary_items = []
 
         # 用語集セクションを探す
-        glossary_section_pattern = r"## 用語集\n(.*?)(?=\n## |$)"
-        glossary_section_match = re.search(glossary_section_pattern, content, re.DOTALL)
-
-        if glossary_section_match:
-            glossary_section = glossary_section_match.group(1)
+        if sections is None:
+            sections = self._extract_sections(content)
+        glossary_section = sections.get("用語集")
 
+        if glossary_section:
             # 用語を抽出（- で始まる行）
-            glossary_pattern = r"- ([^:]+): ([^\n]+)"
-            glossary_matches = re.findall(glossary_pattern, glossary_section)
+            glossary_matches = _GLOSSARY_RE.findall(glossary_section)
 
             for term, definition in glossary_matches:
                 item = GlossaryItem(
@@ -5,6 +5,7 @@ Notion連携サービス
 """
 import json
 import time
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
@@ -16,6 +17,93 @@ from ..infrastructure.storage import storage_manager
 from ..utils.time_utils import format_time
 
 
+# NotionのページIDに使用できる文字（16進数）
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# リッチテキスト要素1つあたりの最大文字数（Notion APIの制限）
+_MAX_RICH_TEXT_LENGTH = 2000
+
+
+def is_notion_id(value: str) -> bool:
+    """
+    NotionのページID（32桁の16進数、またはハイフン区切りのUUID形式）かどうかを判定
+
+    uuid.UUID() で例外を発生させて判定するよりも軽量です。
+
+    Args:
+        value: 判定する文字列
+
+    Returns:
+        ページIDの形式であればTrue、それ以外はFalse
+    """
+    if not isinstance(value, str):
+        return False
+    stripped = value.replace("-", "") if "-" in value else value
+    return len(stripped) == 32 and _HEX_DIGITS.issuperset(stripped)
+
+
+def _rich_text(content: str) -> Dict:
+    """
+    プレーンテキストのリッチテキスト要素を作成
+
+    Args:
+        content: テキスト
+
+    Returns:
+        リッチテキスト要素
+    """
+    return {"type": "text", "text": {"content": content}}
+
+
+def _chunks(text: str, size: int = _MAX_RICH_TEXT_LENGTH) -> List[str]:
+    """
+    テキストを指定された文字数ごとに機械的に分割
+
+    Args:
+        text: 分割するテキスト
+        size: 1チャンクの最大文字数
+
+    Returns:
+        分割されたテキストのリスト（空文字列の場合は空文字列1つ）
+    """
+    if len(text) <= size:
+        return [text]
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _rich_text_list(content: str) -> List[Dict]:
+    """
+    Notionの文字数上限を超えないリッチテキスト要素のリストを作成
+
+    Args:
+        content: テキスト
+
+    Returns:
+        リッチテキスト要素のリスト
+    """
+    return [_rich_text(chunk) for chunk in _chunks(content)]
+
+
+def _paragraph_block(content: str) -> Dict:
+    """
+    段落ブロックを作成
+
+    Args:
+        content: 段落テキスト
+
+    Returns:
+        段落ブロック
+    """
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": _rich_text_list(content),
+            "color": "default"
+        }
+    }
+
+
 class NotionService:
     """Notion連携サービスクラス"""
 
@@ -224,7 +312,7 @@ class NotionService:
             "object": "block",
             "type": heading_type,
             heading_type: {
-                "rich_text": [{"type": "text", "text": {"content": text}}],
+                "rich_text": _rich_text_list(text),
                 "color": "default"
             }
         }
@@ -241,27 +329,9 @@ class NotionService:
         """
         # テキストが長すぎる場合は分割
         if len(text) > self.max_block_size:
-            chunks = self._split_text(text, self.max_block_size)
-            blocks = []
-            for chunk in chunks:
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{"type": "text", "text": {"content": chunk}}],
-                        "color": "default"
-                    }
-                })
-            return blocks
+            return [_paragraph_block(chunk) for chunk in self._split_text(text, self.max_block_size)]
 
-        return {
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{"type": "text", "text": {"content": text}}],
-                "color": "default"
-            }
-        }
+        return _paragraph_block(text)
 
     def _create_bulleted_list_block(self, items: List[str]) -> List[Dict]:
         """
@@ -279,7 +349,7 @@ class NotionService:
                 "object": "block",
                 "type": "bulleted_list_item",
                 "bulleted_list_item": {
-                    "rich_text": [{"type": "text", "text": {"content": item}}],
+                    "rich_text": _rich_text_list(item),
                     "color": "default"
                 }
             })
@@ -352,14 +422,7 @@ class NotionService:
         }
 
         if title:
-            block["bookmark"]["caption"] = [
-                {
-                    "type": "text",
-                    "text": {
-                        "content": title
-                    }
-                }
-            ]
+            block["bookmark"]["caption"] = [_rich_text(title)]
 
         return block
 
@@ -375,7 +438,9 @@ class NotionService:
             分割されたテキストのリスト
         """
         chunks = []
-        current_chunk = ""
+        # 作成中のチャンクは部分文字列のリストで保持し、確定時に一度だけ結合する
+        current_parts: List[str] = []
+        current_length = 0
 
         # 段落ごとに分割
         paragraphs = text.split("\n")
@@ -386,27 +451,37 @@ class NotionService:
                 # 文ごとに分割
                 sentences = paragraph.split(". ")
                 for sentence in sentences:
-                    if len(current_chunk) + len(sentence) + 2 <= max_length:
-                        if current_chunk:
-                            current_chunk += ". " if not current_chunk.endswith(".") else " "
-                        current_chunk += sentence
+                    if current_length + len(sentence) + 2 <= max_length:
+                        if current_parts:
+                            separator = ". " if not current_parts[-1].endswith(".") else " "
+                            current_parts.append(separator)
+                            current_length += len(separator)
+                        if sentence:
+                            current_parts.append(sentence)
+                            current_length += len(sentence)
                     else:
-                        if current_chunk:
-                            chunks.append(current_chunk + ("." if not current_chunk.endswith(".") else ""))
-                        current_chunk = sentence
+                        if current_parts:
+                            chunk = "".join(current_parts)
+                            chunks.append(chunk + ("." if not chunk.endswith(".") else ""))
+                        current_parts = [sentence] if sentence else []
+                        current_length = len(sentence)
             else:
                 # 段落が最大長以内の場合
-                if len(current_chunk) + len(paragraph) + 1 <= max_length:
-                    if current_chunk:
-                        current_chunk += "\n"
-                    current_chunk += paragraph
+                if current_length + len(paragraph) + 1 <= max_length:
+                    if current_parts:
+                        current_parts.append("\n")
+                        current_length += 1
+                    if paragraph:
+                        current_parts.append(paragraph)
+                        current_length += len(paragraph)
                 else:
-                    chunks.append(current_chunk)
-                    current_chunk = paragraph
+                    chunks.append("".join(current_parts))
+                    current_parts = [paragraph] if paragraph else []
+                    current_length = len(paragraph)
 
         # 残りのテキストを追加
-        if current_chunk:
-            chunks.append(current_chunk)
+        if current_parts:
+            chunks.append("".join(current_parts))
 
         return chunks
 
@@ -441,7 +516,6 @@ class NotionService:
                 #     response = notion_client.pages.create(parent={"database_id": self.database_id}, properties=properties)
 
                 # モック応答（実際の実装では削除）
-                import uuid
                 mock_page_id = str(uuid.uuid4())
 
                 # ブロックを追加
@@ -485,10 +559,7 @@ class NotionService:
             # MOCページIDの形式チェック（存在する場合）
             if moc_page_id:
                 # UUIDの形式チェック（実際の実装ではNotion APIの仕様に合わせて調整）
-                import uuid
-                try:
-                    uuid.UUID(moc_page_id)
-                except ValueError:
+                if not is_notion_id(moc_page_id):
                     logger.error(f"無効なMOCページIDの形式です: {moc_page_id}")
                     raise ValueError(f"無効なMOCページIDの形式です: {moc_page_id}")
 
@@ -596,10 +667,7 @@ class NotionService:
                 raise RuntimeError("MOCページの作成に失敗しました: ページIDが取得できません")
 
             # UUIDの形式チェック
-            import uuid
-            try:
-                uuid.UUID(moc_page_id)
-            except ValueError:
+            if not is_notion_id(moc_page_id):
                 logger.error(f"作成されたMOCページIDの形式が無効です: {moc_page_id}")
                 raise ValueError(f"作成されたMOCページIDの形式が無効です: {moc_page_id}")
 
@@ -636,14 +704,10 @@ class NotionService:
                 raise ValueError("議事録のNotionページIDが設定されていません")
 
             # UUIDの形式チェック
-            import uuid
-            try:
-                uuid.UUID(moc_page_id)
-                if minutes.notion_page_id:
-                    uuid.UUID(minutes.notion_page_id)
-            except ValueError as e:
-                logger.error(f"無効なページIDの形式です: {e}")
-                raise ValueError(f"無効なページIDの形式です: {e}")
+            for page_id in (moc_page_id, minutes.notion_page_id):
+                if not is_notion_id(page_id):
+                    logger.error(f"無効なページIDの形式です: {page_id}")
+                    raise ValueError(f"無効なページIDの形式です: {page_id}")
 
             # 実際の実装では、Notion APIを使用してMOCページを取得し、
             # 「議事録一覧」セクションの下に新しいページへのリンクを追加する
@@ -4,7 +4,9 @@
 このモジュールは、音声ファイルの文字起こしに関するサービスを提供します。
 Gemini APIを使用して高精度な文字起こしを実現します。
 """
+import io
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
@@ -16,12 +18,18 @@ from ..domain.transcription import (
     HallucinationResult, HallucinationSeverity, Speaker,
     TranscriptionResult, TranscriptionSegment, TranscriptionStatus
 )
+from ..infrastructure.cache import ResultCache, file_digest, file_fingerprint
 from ..infrastructure.config import config_manager
 from ..infrastructure.logger import logger
 from ..infrastructure.storage import storage_manager
 from ..utils.parallel import ParallelExecutionMode, parallel_map
 from ..utils.time_utils import format_time, time_str_to_seconds
 
+# 文字起こしのセグメント行（例: [00:00:00 - 00:00:10] 話者A: これはテストです。）
+_SEGMENT_RE = re.compile(r'\[(\d{1,2}:\d{2}:\d{2})\s*-\s*(\d{1,2}:\d{2}:\d{2})\]\s*([^:]+):\s*(.*)')
+# 新しいセグメントの開始（タイムスタンプ部分）
+_SEGMENT_START_RE = re.compile(r'\[(\d{1,2}:\d{2}:\d{2})\s*-\s*(\d{1,2}:\d{2}:\d{2})\]')
+
 
 class TranscriptionService:
     """文字起こしサービスクラス"""
@@ -37,6 +45,14 @@ class TranscriptionService:
         # レート制限のための変数
         self.requests_per_minute = config_manager.get("transcription.requests_per_minute", 5)  # デフォルトは1分あたり5リクエスト
         self.request_timestamps = []  # リクエストのタイムスタンプを記録するリスト
+        self._rate_limit_lock = threading.Lock()  # レート制限チェック用のロック
+
+        # 文字起こし結果のキャッシュ（同じ内容のファイルはAPIを呼び出さずに結果を再利用する）
+        cache_dir = Path(config_manager.get("cache_dir", "cache"))
+        self.cache = ResultCache(
+            cache_dir / "transcripts.db",
+            config_manager.get("cache.max_size_mb", 512) * 1024 * 1024
+        )
 
     def combine_transcriptions(self, transcription_results: List[TranscriptionResult], original_source_file: Optional[Path] = None) -> TranscriptionResult:
         """
@@ -112,6 +128,17 @@ class TranscriptionService:
         Returns:
             文字起こし結果
         """
+        # キャッシュされた結果があれば再利用
+        cache_key = self._get_cache_key(media_file)
+        if cache_key is not None:
+            cached_result = self.cache.get(cache_key)
+            if cached_result is not None:
+                logger.info(f"キャッシュされた文字起こし結果を使用します: {media_file.file_path}")
+                cached_result.source_file = media_file.file_path
+                # 出力先が変わった場合や別名の同一ファイルでも文字起こし結果のファイルを作成する
+                self._save_transcription_result(cached_result)
+                return cached_result
+
         # 結果オブジェクトを初期化
         result = TranscriptionResult(
             source_file=media_file.file_path,
@@ -133,12 +160,48 @@ class TranscriptionService:
             # 結果を保存
             self._save_transcription_result(result)
 
+            if cache_key is not None and result.is_completed:
+                self.cache.set(cache_key, result)
+
             return result
         except Exception as e:
             logger.error(f"文字起こしに失敗しました: {e}")
             result.status = TranscriptionStatus.FAILED
             return result
 
+    def _get_cache_key(self, media_file: MediaFile) -> Optional[str]:
+        """
+        文字起こし結果のキャッシュキーを取得
+
+        ファイル内容のハッシュ値と使用するモデル名から生成します。
+        ハッシュ値はファイルのパス・サイズ・更新日時をキーとして記録しておき、
+        ファイルが変更されていなければ再計算しません（cache.strict が有効な場合は常に再計算）。
+
+        Args:
+            media_file: 音声ファイル
+
+        Returns:
+            キャッシュキー、キャッシュが無効な場合や計算できない場合はNone
+        """
+        if not config_manager.get("cache.enabled", True):
+            return None
+
+        try:
+            fingerprint_key = f"file:{file_fingerprint(media_file.file_path)}"
+            digest = None
+            if not config_manager.get("cache.strict", False):
+                digest = self.cache.get(fingerprint_key)
+
+            if digest is None:
+                digest = file_digest(media_file.file_path)
+                self.cache.set(fingerprint_key, digest)
+        except OSError as e:
+            logger.warning(f"キャッシュキーの計算に失敗しました: {media_file.file_path} - {e}")
+            return None
+
+        model_name = config_manager.get("gemini.model", "gemini-2.0-flash")
+        return f"{model_name}:{digest}"
+
     def _transcribe_chunks(self, media_file: MediaFile) -> TranscriptionResult:
         """
         チャンクに分割されたメディアファイルを文字起こし
@@ -251,7 +314,7 @@ class TranscriptionService:
             logger.warning(f"プロンプトファイルが見つかりません: {self.prompt_path}")
             return "音声を文字起こししてください。話者を区別し、タイムスタンプを含めてください。"
 
-        return storage_manager.load_text(self.prompt_path)
+        return storage_manager.load_text(self.prompt_path, cache=True)
 
     def _extract_retry_delay_from_error(self, error) -> float:
         """
@@ -270,7 +333,6 @@ class TranscriptionService:
             # RESOURCE_EXHAUSTEDエラーかどうかを確認
             if "RESOURCE_EXHAUSTED" in error_str:
                 # retryDelayを抽出
-                import re
                 retry_delay_match = re.search(r"'retryDelay': '(\d+)s'", error_str)
                 if retry_delay_match:
                     return float(retry_delay_match.group(1))
@@ -331,11 +393,11 @@ class TranscriptionService:
         retry_count = 0
         while retry_count <= self.max_retries:
             try:
-                # レート制限をチェック
-                self._check_rate_limit()
-
-                # リクエストのタイムスタンプを記録
-                self.request_timestamps.append(time.time())
+                # レート制限をチェックし、リクエストのタイムスタンプを記録
+                # （複数ファイルの並列処理時にタイムスタンプが競合しないようロックで保護）
+                with self._rate_limit_lock:
+                    self._check_rate_limit()
+                    self.request_timestamps.append(time.time())
 
                 # 音声ファイルをアップロード
                 my_file = client.files.upload(file=str(file_path))
@@ -393,41 +455,41 @@ class TranscriptionService:
         """
         # 文字起こしテキストをセグメントに分割
         segments = []
-        current_lines = transcription.strip().split('\n')
-        idx = 0
-
-        while idx < len(current_lines):
-            line = current_lines[idx].strip()
+        # 複数行にわたるセグメントのテキスト（次のセグメントの開始時に結合）
+        continuation_parts: Optional[List[str]] = None
+
+        # 全行のリストを作らず、1行ずつ処理
+        for raw_line in io.StringIO(transcription.strip()):
+            line = raw_line.strip()
+
+            # 複数行にわたるテキストの処理
+            if continuation_parts is not None:
+                # 次の行が新しいセグメントの開始でなければ、現在のテキストに追加
+                if not _SEGMENT_START_RE.match(line):
+                    continuation_parts.append(line)
+                    continue
+                segments[-1].text = " ".join(continuation_parts)
+                continuation_parts = None
 
             # 空行はスキップ
             if not line:
-                idx += 1
                 continue
 
             try:
 
                 # タイムスタンプと話者、テキストを抽出
                 # 例: [00:00:00 - 00:00:10] 話者A: これはテストです。
-                segment_match = re.match(r'\[(\d{1,2}:\d{2}:\d{2})\s*-\s*(\d{1,2}:\d{2}:\d{2})\]\s*([^:]+):\s*(.*)', line)
+                segment_match = _SEGMENT_RE.match(line)
 
                 if segment_match:
                     # セグメント情報を抽出
                     start_str, end_str, speaker_name, text_content = segment_match.groups()
                     start_time = time_str_to_seconds(start_str)
                     end_time = time_str_to_seconds(end_str)
-                    speaker = Speaker(id=speaker_name.strip(), name=speaker_name.strip())
+                    speaker_name = speaker_name.strip()
+                    speaker = Speaker.get(speaker_name, speaker_name)
                     current_text_content = text_content.strip()
 
-                    # 複数行にわたるテキストの処理
-                    while idx + 1 < len(current_lines):
-                        next_line = current_lines[idx+1].strip()
-                        # 次の行が新しいセグメントの開始でなければ、現在のテキストに追加
-                        if not re.match(r'\[(\d{1,2}:\d{2}:\d{2})\s*-\s*(\d{1,2}:\d{2}:\d{2})\]', next_line):
-                            current_text_content += " " + next_line
-                            idx += 1
-                        else:
-                            break
-
                     # セグメントを追加
                     segments.append(TranscriptionSegment(
                         text=current_text_content,
@@ -435,6 +497,7 @@ class TranscriptionService:
                         end_time=end_time,
                         speaker=speaker
                     ))
+                    continuation_parts = [current_text_content]
                 elif segments:
                     # 既存のセグメントがあれば、最後のセグメントにテキストを追加
                     segments[-1].text += f" {line}"
@@ -450,7 +513,9 @@ class TranscriptionService:
             except Exception as e:
                 logger.warning(f"文字起こし行のパースに失敗しました: {line} - {e}")
 
-            idx += 1
+        # 最後のセグメントのテキストを結合
+        if continuation_parts is not None:
+            segments[-1].text = " ".join(continuation_parts)
 
         return segments
 
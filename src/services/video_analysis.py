@@ -93,7 +93,7 @@ class VideoAnalysisService:
             logger.warning(f"プロンプトファイルが見つかりません: {self.prompt_path}")
             return "動画から抽出した画像を分析し、内容を説明してください。"
 
-        return storage_manager.load_text(self.prompt_path)
+        return storage_manager.load_text(self.prompt_path, cache=True)
 
 
     def _format_time(self, seconds: float) -> str:
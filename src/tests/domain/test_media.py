@@ -8,7 +8,7 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 import os
 
-from src.domain.media import MediaFile, MediaChunk, ExtractedImage
+from src.domain.media import MediaFile, MediaChunk, ExtractedImage, MediaType, VideoQuality
 
 
 class TestMediaFile(unittest.TestCase):
@@ -80,6 +80,19 @@ class TestMediaFile(unittest.TestCase):
         # 検証
         self.assertTrue(media_file.is_long_media)
 
+    def test_media_flags(self):
+        """メディアの種類と長さの判定をテスト"""
+        media_file = MediaFile(file_path=Path("test.mp4"), media_type=MediaType.VIDEO, duration=3000.0)
+
+        self.assertTrue(media_file.is_video)
+        self.assertFalse(media_file.is_audio)
+        self.assertTrue(media_file.is_long_media)
+        self.assertFalse(media_file.is_dark_video)
+
+        media_file.video_quality = VideoQuality.DARK
+
+        self.assertTrue(media_file.is_dark_video)
+
     def test_add_chunk(self):
         """チャンクの追加をテスト"""
         # テスト用のデータ
@@ -176,6 +189,17 @@ class TestMediaChunk(unittest.TestCase):
         self.assertEqual(chunk.parent_file, self.parent_file)
         self.assertEqual(chunk.duration, 60.0)
 
+    def test_hash_and_equality(self):
+        """同じ値のMediaChunkが等価でハッシュ値も一致することをテスト"""
+        chunk = MediaChunk(start_time=0.0, end_time=60.0, file_path=Path("chunk_0.mp3"), index=0)
+        same = MediaChunk(start_time=0.0, end_time=60.0, file_path=Path("chunk_0.mp3"), index=0)
+        other = MediaChunk(start_time=60.0, end_time=120.0, file_path=Path("chunk_1.mp3"), index=1)
+
+        self.assertEqual(chunk, same)
+        self.assertEqual(hash(chunk), hash(same))
+        self.assertNotEqual(chunk, other)
+        self.assertEqual(len({chunk, same, other}), 2)
+
     def test_create_media_chunk_non_existing(self):
         """存在しないファイルでのMediaChunkの作成をテスト"""
         # モックの設定
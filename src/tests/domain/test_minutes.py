@@ -195,7 +195,7 @@ class TestMinutes(unittest.TestCase):
         self.assertEqual(minutes.format, MinutesFormat.MARKDOWN)
         self.assertIsNone(minutes.lecturer)
         self.assertIsNone(minutes.subject)
-        self.assertEqual(minutes.attendees, [])
+        self.assertEqual(minutes.attendees, ())
         self.assertIsNone(minutes.output_path)
 
     def test_create_minutes_with_optional_fields(self):
@@ -251,6 +251,37 @@ class TestMinutes(unittest.TestCase):
         self.assertIn(section, minutes.content.paragraphs)
         self.assertEqual(minutes.content.paragraphs[section][0], "これはテスト用の要約です。")
 
+    def test_add_attendee(self):
+        """出席者の追加をテスト"""
+        minutes = Minutes(
+            title="テスト議事録",
+            date=datetime.now(),
+            content=MinutesContent(),
+            source_transcription=self.transcription
+        )
+
+        minutes.add_attendee("鈴木")
+        minutes.add_attendee("佐藤")
+
+        self.assertEqual(minutes.attendees, ("鈴木", "佐藤"))
+
+    def test_add_paragraph_text(self):
+        """段落テキストが指定したセクションにのみ追加されることをテスト"""
+        minutes = Minutes(
+            title="テスト議事録",
+            date=datetime.now(),
+            content=MinutesContent(),
+            source_transcription=self.transcription,
+            format=MinutesFormat.MARKDOWN
+        )
+
+        minutes.add_paragraph(MinutesSection.CONTENT, "本文の段落です。")
+
+        self.assertEqual(minutes.content.paragraphs[MinutesSection.CONTENT], ["本文の段落です。"])
+        self.assertEqual(minutes.content.paragraphs[MinutesSection.SUMMARY], [])
+        with self.assertRaises(TypeError):
+            minutes.content.paragraphs[MinutesSection.SUMMARY] = []
+
     def test_add_heading(self):
         """見出しの追加をテスト"""
         # テスト用のデータ
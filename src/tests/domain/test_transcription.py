@@ -45,6 +45,16 @@ class TestSpeaker(unittest.TestCase):
         self.assertEqual(speaker1, speaker2)
         self.assertNotEqual(speaker1, speaker3)
 
+    def test_get_shares_instance(self):
+        """同じIDと名前の話者が同じインスタンスを共有することをテスト"""
+        speaker1 = Speaker.get("".join(["speaker", "1"]), "山田太郎")
+        speaker2 = Speaker.get("speaker1", "山田太郎")
+        speaker3 = Speaker.get("speaker1")
+
+        self.assertIs(speaker1, speaker2)
+        self.assertIsNot(speaker1, speaker3)
+        self.assertIsNone(speaker3.name)
+
 
 class TestTranscriptionSegment(unittest.TestCase):
     """TranscriptionSegmentクラスのテストクラス"""
@@ -296,6 +306,27 @@ class TestTranscriptionResult(unittest.TestCase):
         self.assertEqual(segments[0], self.segment1)  # 0.0-5.0
         self.assertEqual(segments[1], self.segment2)  # 5.5-10.0
 
+    def test_get_segment_at_time(self):
+        """指定時間のセグメントの取得をテスト"""
+        # テスト用のデータ
+        result = TranscriptionResult(
+            source_file=self.source_file,
+            status=TranscriptionStatus.COMPLETED,
+            segments=[self.segment1, self.segment2, self.segment3]
+        )
+
+        # 検証
+        self.assertEqual(result.get_segment_at_time(0.0), self.segment1)
+        self.assertEqual(result.get_segment_at_time(7.0), self.segment2)
+        self.assertEqual(result.get_segment_at_time(15.0), self.segment3)
+        self.assertIsNone(result.get_segment_at_time(5.2))
+        self.assertIsNone(result.get_segment_at_time(20.0))
+
+        # セグメント追加後も検索できることを確認
+        segment4 = TranscriptionSegment(text="さようなら。", start_time=16.0, end_time=20.0)
+        result.segments.append(segment4)
+        self.assertEqual(result.get_segment_at_time(20.0), segment4)
+
     def test_full_text(self):
         """全テキストの取得をテスト"""
         # テスト用のデータ
@@ -312,6 +343,52 @@ class TestTranscriptionResult(unittest.TestCase):
         expected_text = "こんにちは、山田です。\nこんにちは、鈴木です。\n今日はいい天気ですね。"
         self.assertEqual(text, expected_text)
 
+    def test_full_text_after_change(self):
+        """セグメント変更後に全テキストが作り直されることをテスト"""
+        # テスト用のデータ
+        result = TranscriptionResult(
+            source_file=self.source_file,
+            status=TranscriptionStatus.COMPLETED,
+            segments=[self.segment1]
+        )
+        self.assertEqual(result.full_text, "こんにちは、山田です。")
+
+        # セグメントの追加
+        result.add_segment(self.segment2)
+        self.assertEqual(result.full_text, "こんにちは、山田です。\nこんにちは、鈴木です。")
+
+        # セグメントのリストの置き換え
+        result.segments = [self.segment3]
+        self.assertEqual(result.full_text, "今日はいい天気ですね。")
+
+    def test_has_hallucinations(self):
+        """ハルシネーションの有無の判定をテスト"""
+        # テスト用のデータ
+        result = TranscriptionResult(
+            source_file=self.source_file,
+            status=TranscriptionStatus.COMPLETED,
+            segments=[self.segment1, self.segment2]
+        )
+        self.assertFalse(result.has_hallucinations)
+
+        # ハルシネーションなしの結果の追加
+        result.add_hallucination_result(
+            HallucinationResult(segment=self.segment1, severity=HallucinationSeverity.NONE)
+        )
+        self.assertFalse(result.has_hallucinations)
+
+        # ハルシネーションありの結果の追加
+        result.add_hallucination_result(
+            HallucinationResult(segment=self.segment2, severity=HallucinationSeverity.HIGH)
+        )
+        self.assertTrue(result.has_hallucinations)
+
+        # 結果のリストの置き換え
+        result.hallucination_results = [
+            HallucinationResult(segment=self.segment1, severity=HallucinationSeverity.NONE)
+        ]
+        self.assertFalse(result.has_hallucinations)
+
     def test_total_duration(self):
         """総時間の計算をテスト"""
         # テスト用のデータ
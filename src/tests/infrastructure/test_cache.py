@@ -0,0 +1,99 @@
+"""
+結果キャッシュのテスト
+
+このモジュールは、インフラストラクチャ層の結果キャッシュ（ResultCache）の機能をテストします。
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.infrastructure.cache import ResultCache, file_digest, file_fingerprint
+
+
+class TestResultCache(unittest.TestCase):
+    """結果キャッシュのテストクラス"""
+
+    def setUp(self):
+        """各テスト実行前の準備"""
+        self.logger_patcher = patch('src.infrastructure.cache.logger')
+        self.mock_logger = self.logger_patcher.start()
+
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache = ResultCache(self.temp_dir / "cache" / "results.db", max_size=1024 * 1024)
+
+    def tearDown(self):
+        """各テスト実行後のクリーンアップ"""
+        self.cache.close()
+        self.logger_patcher.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_get_missing(self):
+        """存在しないキーでNoneが返されることをテスト"""
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_set_and_get(self):
+        """保存した値が取得できることをテスト"""
+        value = {"segments": ["こんにちは"], "duration": 1.5}
+
+        self.cache.set("key", value)
+
+        self.assertEqual(self.cache.get("key"), value)
+        self.assertTrue((self.temp_dir / "cache" / "results.db").exists())
+
+    def test_evict_least_recently_used(self):
+        """上限を超えた場合に最も長く参照されていないエントリが削除されることをテスト"""
+        cache = ResultCache(self.temp_dir / "small.db", max_size=250)
+        try:
+            with patch('src.infrastructure.cache.time.time', side_effect=[1.0, 2.0, 3.0, 4.0]):
+                cache.set("a", b"x" * 100)
+                cache.set("b", b"x" * 100)
+                cache.get("a")
+                cache.set("c", b"x" * 100)
+
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(cache.get("a"), b"x" * 100)
+            self.assertEqual(cache.get("c"), b"x" * 100)
+        finally:
+            cache.close()
+
+    def test_clear(self):
+        """キャッシュの全削除をテスト"""
+        self.cache.set("key", "value")
+
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_file_digest(self):
+        """ファイル内容のハッシュ値の計算をテスト"""
+        first = self.temp_dir / "first.wav"
+        second = self.temp_dir / "second.wav"
+        first.write_bytes(b"audio data")
+        second.write_bytes(b"audio data")
+
+        self.assertEqual(file_digest(first), file_digest(second))
+
+        second.write_bytes(b"other data")
+
+        self.assertNotEqual(file_digest(first), file_digest(second))
+
+    def test_file_fingerprint(self):
+        """更新日時が変わると識別子が変わることをテスト"""
+        file_path = self.temp_dir / "audio.wav"
+        file_path.write_bytes(b"audio data")
+        os.utime(file_path, ns=(1_000_000_000, 1_000_000_000))
+
+        fingerprint = file_fingerprint(file_path)
+
+        self.assertEqual(file_fingerprint(file_path), fingerprint)
+
+        os.utime(file_path, ns=(2_000_000_000, 2_000_000_000))
+
+        self.assertNotEqual(file_fingerprint(file_path), fingerprint)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -104,6 +104,17 @@ class TestConfigManager(unittest.TestCase):
         # 検証
         self.assertEqual(value, "音声文字起こし・議事録自動生成ツール")
 
+    def test_get_nested_key_after_set(self):
+        """設定変更後にネストされたキーの取得結果が更新されることをテスト"""
+        # 変更前の値を取得（検索結果がキャッシュされる）
+        self.assertEqual(self.config_manager.get("test_section.value", "default_value"), "default_value")
+
+        # テスト実行
+        self.config_manager.set("test_section.value", 10)
+
+        # 検証
+        self.assertEqual(self.config_manager.get("test_section.value", "default_value"), 10)
+
     def test_get_non_existing_key(self):
         """存在しないキーの取得をテスト"""
         # テスト用のデータを設定
@@ -0,0 +1,143 @@
+"""
+JSON読み込みのテスト
+
+このモジュールは、インフラストラクチャ層のJSON読み込み（json_loader）の機能をテストします。
+"""
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from src.domain.minutes import Minutes, MinutesContent, MinutesSection
+from src.domain.transcription import Speaker, TranscriptionResult, TranscriptionSegment, TranscriptionStatus
+from src.infrastructure import json_loader
+
+
+@dataclass(slots=True)
+class _Segment:
+    """変換テスト用のデータクラス"""
+    text: str
+    start_time: float
+
+
+class TestJsonLoader(unittest.TestCase):
+    """JSON読み込みのテストクラス"""
+
+    def test_load_text_file(self):
+        """テキストモードのファイルからの読み込みをテスト"""
+        data = json_loader.load(io.StringIO('{"language_name": "日本語"}'))
+
+        self.assertEqual(data, {"language_name": "日本語"})
+
+    def test_load_binary_file(self):
+        """バイナリモードのファイルからの読み込みをテスト"""
+        data = json_loader.load(io.BytesIO('{"曜日": ["月曜日"]}'.encode("utf-8")))
+
+        self.assertEqual(data, {"曜日": ["月曜日"]})
+
+    def test_loads_invalid(self):
+        """不正なJSONで JSONDecodeError が発生することをテスト"""
+        with self.assertRaises(json_loader.JSONDecodeError):
+            json_loader.loads("{invalid")
+
+    def test_loads_without_orjson(self):
+        """orjsonがない場合に標準のjsonで解析されることをテスト"""
+        with patch.object(json_loader, "orjson", None):
+            self.assertEqual(json_loader.loads(memoryview(b'{"a": 1}')), {"a": 1})
+            with self.assertRaises(json_loader.JSONDecodeError):
+                json_loader.loads("{invalid")
+
+    def test_dumps(self):
+        """インデント付きJSONへの変換をテスト"""
+        data = {"subject": "情報処理", "periods": [1, 2]}
+
+        result = json_loader.dumps(data)
+
+        self.assertEqual(result, json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
+
+    def test_dumps_without_orjson(self):
+        """orjsonがない場合に標準のjsonで変換されることをテスト"""
+        data = {"subject": "情報処理", "periods": [1, 2]}
+
+        with patch.object(json_loader, "orjson", None):
+            result = json_loader.dumps(data)
+
+        self.assertEqual(json.loads(result.decode("utf-8")), data)
+        self.assertIn("情報処理".encode("utf-8"), result)
+
+    def test_dumps_dataclass(self):
+        """データクラスを含むデータの変換をテスト"""
+        data = {"segment": _Segment(text="こんにちは", start_time=1.5), "saved_at": datetime(2024, 4, 1, 9, 0)}
+        expected = {"segment": {"text": "こんにちは", "start_time": 1.5}, "saved_at": "2024-04-01T09:00:00"}
+
+        self.assertEqual(json.loads(json_loader.dumps(data)), expected)
+        with patch.object(json_loader, "orjson", None):
+            self.assertEqual(json.loads(json_loader.dumps(data)), expected)
+
+    def test_dumps_domain_object(self):
+        """ドメインモデルの変換結果がorjsonの有無で一致することをテスト"""
+        transcription = TranscriptionResult(
+            source_file=Path("input/lecture.mp4"),
+            segments=[TranscriptionSegment(text="こんにちは", start_time=0.0, end_time=1.5,
+                                           speaker=Speaker.get("1", "講師"))],
+            status=TranscriptionStatus.COMPLETED
+        )
+        transcription.full_text  # 非公開のキャッシュを作成しておく
+        minutes = Minutes(
+            title="情報処理 議事録",
+            date=datetime(2024, 4, 1, 9, 0),
+            content=MinutesContent(),
+            source_transcription=transcription,
+            output_path=Path("output/minutes.md")
+        )
+        minutes.add_paragraph(MinutesSection.SUMMARY, "概要です")
+        minutes.metadata = {MinutesSection.TASKS: ["課題1"]}
+        data = {"minutes": minutes, "sections": {MinutesSection.SUMMARY: ["a"], datetime(2024, 4, 1): 1}}
+
+        output = json.loads(json_loader.dumps(data))
+        with patch.object(json_loader, "orjson", None):
+            self.assertEqual(json.loads(json_loader.dumps(data)), output)
+
+        self.assertEqual(output["sections"], {str(MinutesSection.SUMMARY.value): ["a"], "2024-04-01T00:00:00": 1})
+        result = output["minutes"]
+        self.assertEqual(result["metadata"], {str(MinutesSection.TASKS.value): ["課題1"]})
+
+        self.assertEqual(result["output_path"], str(Path("output/minutes.md")))
+        self.assertEqual(result["content"]["paragraphs"][str(MinutesSection.SUMMARY.value)], ["概要です"])
+        self.assertNotIn("_paragraphs_view", result["content"])
+        self.assertEqual(result["source_transcription"]["source_file"], str(Path("input/lecture.mp4")))
+        self.assertEqual(result["source_transcription"]["segments"][0]["speaker"], {"id": "1", "name": "講師"})
+        self.assertNotIn("_full_text_cache", result["source_transcription"])
+
+    def test_load_file(self):
+        """ファイルパスからの読み込みをテスト"""
+        temp_dir = Path(tempfile.mkdtemp())
+        try:
+            file_path = temp_dir / "settings.json"
+            file_path.write_text('{"language": "ja"}', encoding="utf-8")
+
+            self.assertEqual(json_loader.load_file(file_path), {"language": "ja"})
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_load_file_mmap(self):
+        """しきい値以上のファイルの読み込みをテスト"""
+        temp_dir = Path(tempfile.mkdtemp())
+        try:
+            file_path = temp_dir / "lang.json"
+            data = {"strings": ["文字列"] * 100}
+            file_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+            with patch.object(json_loader, "MMAP_THRESHOLD", 1):
+                self.assertEqual(json_loader.load_file(file_path), data)
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
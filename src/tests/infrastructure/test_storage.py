@@ -116,26 +116,46 @@ class TestStorageManager(unittest.TestCase):
     def test_copy_file(self):
         """ファイルのコピーをテスト"""
         # テスト実行
-        dest_path = self.storage_manager.copy_file(Path("source.txt"), Path("dest.txt"))
+        dest_path = self.storage_manager.copy_file(Path("source.txt"), Path("dest.txt"), preserve_metadata=True)
         
         # 検証
         self.mock_shutil.assert_called_once_with(Path("source.txt"), Path("dest.txt"))
         self.assertEqual(dest_path, Path("dest.txt"))
 
-    @patch('pathlib.Path.glob')
-    def test_list_files(self, mock_glob):
+    @patch('shutil.copyfile')
+    def test_copy_file_without_metadata(self, mock_copyfile):
+        """メタデータを除いたファイルのコピーをテスト"""
+        self.mock_path_exists.return_value = True
+
+        dest_path = self.storage_manager.copy_file(Path("source.txt"), Path("dest.txt"))
+
+        mock_copyfile.assert_called_once_with(Path("source.txt"), Path("dest.txt"))
+        self.mock_shutil.assert_not_called()
+        self.assertEqual(dest_path, Path("dest.txt"))
+
+    @patch('src.infrastructure.storage.os.scandir')
+    def test_list_files(self, mock_scandir):
         """ファイル一覧の取得をテスト"""
         # モックの設定
-        mock_glob.return_value = [Path("file1.txt"), Path("file2.txt")]
+        entries = []
+        for name in ["file1.txt", "image.png", "file2.txt"]:
+            entry = MagicMock()
+            entry.name = name
+            entry.path = os.path.join("dir", name)
+            entries.append(entry)
+        mock_scandir.return_value.__enter__.return_value = iter(entries)
         
         # テスト実行
         files = self.storage_manager.list_files(Path("dir"), "*.txt")
         
         # 検証
-        mock_glob.assert_called_once_with("*.txt")
-        self.assertEqual(len(files), 2)
-        self.assertEqual(files[0], Path("file1.txt"))
-        self.assertEqual(files[1], Path("file2.txt"))
+        mock_scandir.assert_called_once_with(Path("dir"))
+        self.assertEqual(files, [Path("dir") / "file1.txt", Path("dir") / "file2.txt"])
+
+    @patch('src.infrastructure.storage.os.scandir', side_effect=FileNotFoundError)
+    def test_list_files_missing_directory(self, mock_scandir):
+        """存在しないディレクトリで空のリストが返されることをテスト"""
+        self.assertEqual(self.storage_manager.list_files(Path("missing")), [])
 
     @patch('os.path.getsize')
     def test_get_file_size(self, mock_getsize):
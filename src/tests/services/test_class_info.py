@@ -0,0 +1,197 @@
+"""
+授業情報サービスのテスト
+
+このモジュールは、授業情報サービス（ClassInfoService）の機能をテストします。
+"""
+import json
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from pathlib import Path
+
+from src.services.class_info import ClassInfoService, invalidate_schedule_cache
+
+
+class TestClassInfoService(unittest.TestCase):
+    """授業情報サービスのテストクラス"""
+
+    def setUp(self):
+        """各テスト実行前の準備"""
+        # モックの設定
+        self.logger_patcher = patch('src.services.class_info.logger')
+        self.mock_logger = self.logger_patcher.start()
+
+        # テスト用のスケジュールファイル
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.schedule_path = self.temp_dir / "schedule.json"
+        self.schedule = {
+            "月曜日": {
+                "1限": {"name": "情報処理", "teacher": "山田", "start_time": "08:50", "end_time": "10:30"}
+            },
+            "special": {}
+        }
+        with open(self.schedule_path, "w", encoding="utf-8") as f:
+            json.dump(self.schedule, f, ensure_ascii=False)
+
+        # テスト用のサービスインスタンス
+        invalidate_schedule_cache()
+        self.service = ClassInfoService()
+        self.service.schedule_path = str(self.schedule_path)
+        self.service.schedule = self.service._load_schedule()
+
+    def tearDown(self):
+        """各テスト実行後のクリーンアップ"""
+        self.logger_patcher.stop()
+        shutil.rmtree(self.temp_dir)
+        invalidate_schedule_cache()
+
+    def test_load_schedule(self):
+        """スケジュールの読み込みをテスト"""
+        self.assertEqual(self.service.schedule, self.schedule)
+
+    def test_schedule_loaded_on_first_access(self):
+        """スケジュールが初回参照時にのみ読み込まれることをテスト"""
+        with patch.object(ClassInfoService, '_load_schedule', return_value=self.schedule) as mock_load:
+            service = ClassInfoService()
+            mock_load.assert_not_called()
+
+            self.assertEqual(service.schedule, self.schedule)
+            self.assertEqual(service.schedule, self.schedule)
+
+        mock_load.assert_called_once()
+
+    def test_load_schedule_uses_cache(self):
+        """更新されていないスケジュールが再解析されないことをテスト"""
+        with patch('src.services.class_info.json_loader.load_file') as mock_load:
+            schedule = self.service._load_schedule()
+
+        mock_load.assert_not_called()
+        self.assertEqual(schedule, self.service.schedule)
+
+    def test_load_schedule_returns_copy(self):
+        """保存していない変更が他のインスタンスのスケジュールに影響しないことをテスト"""
+        other = ClassInfoService()
+        other.schedule_path = str(self.schedule_path)
+
+        self.service.add_special_class("2024-04-01", "1限", {"name": "特別講義"}, commit=False)
+
+        self.assertIsNot(other.schedule, self.service.schedule)
+        self.assertEqual(other.schedule["special"], {})
+
+    def test_load_schedule_after_invalidate(self):
+        """キャッシュ破棄後にスケジュールが再解析されることをテスト"""
+        invalidate_schedule_cache()
+
+        schedule = self.service._load_schedule()
+
+        self.assertIsNot(schedule, self.service.schedule)
+        self.assertEqual(schedule, self.schedule)
+
+    def test_extract_date_from_filename(self):
+        """日付形式の優先順位と日付を含まないファイル名の判定をテスト"""
+        # MM-DD形式が先に現れても、YYYYMMDD形式が優先される
+        date_info = self.service._extract_date_from_filename("04-02_20240401")
+
+        self.assertEqual(date_info["date"], datetime(2024, 4, 1))
+        self.assertEqual(date_info["pattern"], "YYYYMMDD")
+        self.assertIsNone(self.service._extract_date_from_filename("lecture_p2"))
+
+    def test_get_time_periods_uses_cache(self):
+        """スケジュールが変わらない間は時間帯が再計算されないことをテスト"""
+        time_periods = self.service._get_time_periods_from_schedule()
+
+        with patch.object(self.service, '_build_time_periods_from_schedule') as mock_build:
+            self.assertIs(self.service._get_time_periods_from_schedule(), time_periods)
+            mock_build.assert_not_called()
+
+            self.service.schedule = dict(self.schedule)
+            self.service._get_time_periods_from_schedule()
+
+        mock_build.assert_called_once()
+
+    def test_extract_period_from_time_in_filename(self):
+        """日付の一部を時刻と誤認せずに時限を推定することをテスト"""
+        self.assertEqual(self.service._extract_period_from_filename("2024-04-01 録画 10-45"), "2")
+        self.assertEqual(self.service._extract_period_from_filename("lecture-10-45"), "2")
+        self.assertIsNone(self.service._extract_period_from_filename("2024-04-01 録画"))
+
+    def test_estimate_period_from_time_overlapping(self):
+        """時間帯が重なる場合に時刻を含む時限のうち時限番号の小さい方が選ばれることをテスト"""
+        time_periods = [((9, 0), (12, 0), "1"), ((10, 0), (11, 0), "2")]
+
+        with patch.object(self.service, '_get_time_periods_from_schedule', return_value=time_periods):
+            self.assertEqual(self.service._estimate_period_from_time(10, 30), "1")
+            self.assertEqual(self.service._estimate_period_from_time(12, 10), "1")
+
+    def test_get_class_info_from_filename(self):
+        """ファイル名からの授業情報の取得をテスト"""
+        # 2024-04-01は月曜日
+        class_info = self.service.get_class_info_from_filename("2024-04-01 1限.mp4")
+
+        self.assertEqual(class_info["subject"], "情報処理")
+        self.assertEqual(class_info["lecturer"], "山田")
+        self.assertEqual(class_info["day_of_week"], "月曜日")
+        self.assertEqual(class_info["period"], "1")
+
+    def test_get_class_info_from_filename_uses_cache(self):
+        """同じファイル名の授業情報が再計算されないことをテスト"""
+        first = self.service.get_class_info_from_filename("2024-04-01 1限.mp4")
+        first["subject"] = "変更"
+
+        with patch.object(self.service, '_extract_date_from_filename') as mock_extract:
+            second = self.service.get_class_info_from_filename("other_dir/2024-04-01 1限.wav")
+
+        mock_extract.assert_not_called()
+        self.assertEqual(second["subject"], "情報処理")
+
+    def test_class_info_cache_size(self):
+        """キャッシュが上限を超えたら最も長く参照されていないものから破棄されることをテスト"""
+        with patch('src.services.class_info._CLASS_INFO_CACHE_SIZE', 2):
+            self.service.get_class_info_from_filename("2024-04-01 1限.mp4")
+            self.service.get_class_info_from_filename("2024-04-08 1限.mp4")
+            self.service.get_class_info_from_filename("2024-04-01 1限.mp4")
+            self.service.get_class_info_from_filename("2024-04-15 1限.mp4")
+
+        self.assertEqual(list(self.service._class_info_cache), ["2024-04-01 1限", "2024-04-15 1限"])
+
+    def test_get_class_info_from_filename_after_schedule_change(self):
+        """スケジュール変更後に授業情報が再計算されることをテスト"""
+        self.service.get_class_info_from_filename("2024-04-01 1限.mp4")
+
+        self.service.add_special_class(
+            "2024-04-01", "1限", {"name": "特別講義", "teacher": "佐藤"}
+        )
+        class_info = self.service.get_class_info_from_filename("2024-04-01 1限.mp4")
+
+        self.assertEqual(class_info["subject"], "特別講義")
+
+    def test_get_class_info_from_filename_after_update_schedule(self):
+        """同じスケジュールを変更して更新した場合に授業情報が再計算されることをテスト"""
+        self.service.get_class_info_from_filename("2024-04-01 1限.mp4")
+
+        self.service.schedule["月曜日"]["1限"]["name"] = "データ構造"
+        self.assertTrue(self.service.update_schedule(self.service.schedule))
+        class_info = self.service.get_class_info_from_filename("2024-04-01 1限.mp4")
+
+        self.assertEqual(class_info["subject"], "データ構造")
+
+
+    def test_add_special_class_without_commit(self):
+        """commit=Falseの場合はflushを呼び出すまでファイルに保存されないことをテスト"""
+        self.service.add_special_class("2024-04-01", "1限", {"name": "特別講義"}, commit=False)
+        self.service.add_special_class("2024-04-02", "2限", {"name": "補講"}, commit=False)
+
+        with open(self.schedule_path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["special"], {})
+
+        self.assertTrue(self.service.flush())
+
+        with open(self.schedule_path, encoding="utf-8") as f:
+            special = json.load(f)["special"]
+        self.assertEqual(special["2024-04-01"]["1限"], {"name": "特別講義"})
+        self.assertEqual(special["2024-04-02"]["2限"], {"name": "補講"})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+文字起こしサービスのテスト
+
+このモジュールは、文字起こしサービス（TranscriptionService）の機能をテストします。
+"""
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+
+from src.domain.media import MediaFile, MediaType
+from src.domain.transcription import TranscriptionResult, TranscriptionSegment, TranscriptionStatus
+from src.services.transcription import TranscriptionService
+
+
+class TestTranscriptionService(unittest.TestCase):
+    """文字起こしサービスのテストクラス"""
+
+    def setUp(self):
+        """各テスト実行前の準備"""
+        # モックの設定
+        self.config_patcher = patch('src.services.transcription.config_manager')
+        self.mock_config = self.config_patcher.start()
+        self.mock_config.get_api_key.return_value = "test_api_key"
+        self.mock_config.get.side_effect = lambda key, default=None: default
+        self.mock_config.get_prompt_path.return_value = Path("test_prompt_path")
+
+        self.logger_patcher = patch('src.services.transcription.logger')
+        self.mock_logger = self.logger_patcher.start()
+
+        self.storage_patcher = patch('src.services.transcription.storage_manager')
+        self.mock_storage = self.storage_patcher.start()
+        self.mock_storage.get_output_dir.return_value = Path("test_output_dir")
+
+        self.cache_patcher = patch('src.services.transcription.ResultCache')
+        self.mock_cache = self.cache_patcher.start().return_value
+
+        # テスト用のサービスインスタンス
+        self.service = TranscriptionService()
+
+    def tearDown(self):
+        """各テスト実行後のクリーンアップ"""
+        self.config_patcher.stop()
+        self.logger_patcher.stop()
+        self.storage_patcher.stop()
+        self.cache_patcher.stop()
+
+    def test_transcribe_audio_cache_hit_saves_transcript(self):
+        """キャッシュされた結果を使用する場合も文字起こし結果のファイルが保存されることをテスト"""
+        cached_result = TranscriptionResult(
+            source_file=Path("original.mp3"),
+            segments=[TranscriptionSegment(text="こんにちは", start_time=0.0, end_time=1.5)],
+            status=TranscriptionStatus.COMPLETED
+        )
+        self.mock_cache.get.return_value = cached_result
+        media_file = MediaFile(file_path=Path("renamed.mp3"), media_type=MediaType.AUDIO, duration=60.0)
+
+        with patch.object(self.service, '_get_cache_key', return_value="key"), \
+                patch.object(self.service, '_transcribe_single_file') as mock_transcribe:
+            result = self.service.transcribe_audio(media_file)
+
+        mock_transcribe.assert_not_called()
+        self.assertIs(result, cached_result)
+        self.assertEqual(result.source_file, Path("renamed.mp3"))
+        self.mock_storage.save_text.assert_called_once()
+        self.assertEqual(
+            self.mock_storage.save_text.call_args[0][1],
+            Path("test_output_dir") / "renamed_transcript.txt"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,13 +6,62 @@
 import json
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
+from ..infrastructure import json_loader
 from ..infrastructure.config import config_manager
 from ..infrastructure.logger import logger
 from ..infrastructure.storage import storage_manager
 
 
+# 読み込み済みの言語ファイル（パス -> ((更新時刻, サイズ), 言語データ)）
+_LANGUAGE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+
+def _read_language_file(lang_file: Path) -> Dict:
+    """
+    言語ファイルを読み込む（更新されていなければ前回の解析結果を再利用）
+
+    Args:
+        lang_file: 言語ファイルのパス
+
+    Returns:
+        言語データ
+    """
+    stat = lang_file.stat()
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _LANGUAGE_CACHE.get(str(lang_file))
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    lang_data = json_loader.load_file(lang_file)
+
+    _LANGUAGE_CACHE[str(lang_file)] = (cache_key, lang_data)
+    return lang_data
+
+
+def _flatten_strings(strings: Dict, prefix: str = "") -> Dict[str, str]:
+    """
+    階層化された言語データをドット区切りのキーで平坦化
+
+    Args:
+        strings: 言語データ
+        prefix: キーの接頭辞
+
+    Returns:
+        ドット区切りのキーと文字列の辞書
+    """
+    flat = {}
+    for key, value in strings.items():
+        full_key = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten_strings(value, f"{full_key}."))
+        elif isinstance(value, str):
+            flat[full_key] = value
+    return flat
+
+
 class LanguageManager:
     """多言語対応クラス"""
 
@@ -21,8 +70,19 @@ class LanguageManager:
         self.lang_dir = Path(config_manager.get("lang_dir", "resources/lang"))
         self.default_lang = config_manager.get("language", "ja")
         self.strings = {}
+        self._flat_strings: Dict[str, str] = {}
         self._load_language(self.default_lang)
 
+    def _set_strings(self, strings: Dict) -> None:
+        """
+        言語データを設定し、検索用の平坦化した辞書を作成
+
+        Args:
+            strings: 言語データ
+        """
+        self.strings = strings
+        self._flat_strings = _flatten_strings(strings)
+
     def _load_language(self, lang_code: str) -> bool:
         """
         言語ファイルを読み込む
@@ -45,23 +105,22 @@ class LanguageManager:
                 return self._load_language(self.default_lang)
                 
             # デフォルト言語も見つからない場合は空の辞書を使用
-            self.strings = {}
+            self._set_strings({})
             return False
             
         try:
             # 言語ファイルを読み込む
-            with open(lang_file, "r", encoding="utf-8") as f:
-                self.strings = json.load(f)
+            self._set_strings(_read_language_file(lang_file))
                 
             logger.info(f"言語ファイルを読み込みました: {lang_file}")
             return True
-        except json.JSONDecodeError as e:
+        except json_loader.JSONDecodeError as e:
             logger.error(f"言語ファイルの解析に失敗しました: {e}")
-            self.strings = {}
+            self._set_strings({})
             return False
         except Exception as e:
             logger.error(f"言語ファイルの読み込みに失敗しました: {e}")
-            self.strings = {}
+            self._set_strings({})
             return False
 
     def get_string(self, key: str, default: Optional[str] = None) -> str:
@@ -75,23 +134,10 @@ class LanguageManager:
         Returns:
             対応する文字列
         """
-        # ドット区切りのキーを処理
-        if "." in key:
-            parts = key.split(".")
-            current = self.strings
-            for part in parts:
-                if isinstance(current, dict) and part in current:
-                    current = current[part]
-                else:
-                    return default if default is not None else key
-            
-            if isinstance(current, str):
-                return current
-            return default if default is not None else key
-        
-        # 単一のキー
-        if key in self.strings and isinstance(self.strings[key], str):
-            return self.strings[key]
+        # ドット区切りのキーは読み込み時に平坦化済み
+        value = self._flat_strings.get(key)
+        if value is not None:
+            return value
             
         return default if default is not None else key
 
@@ -131,10 +177,8 @@ class LanguageManager:
             
             try:
                 # 言語ファイルから言語名を取得
-                with open(lang_file, "r", encoding="utf-8") as f:
-                    lang_data = json.load(f)
-                    lang_name = lang_data.get("language_name", lang_code)
-                    languages[lang_code] = lang_name
+                lang_data = _read_language_file(lang_file)
+                languages[lang_code] = lang_data.get("language_name", lang_code)
             except Exception as e:
                 logger.warning(f"言語ファイルの読み込みに失敗しました: {lang_file} - {e}")
                 languages[lang_code] = lang_code
@@ -153,7 +197,11 @@ class LanguageManager:
             フォーマットされた文字列
         """
         template = self.get_string(key)
-        
+
+        # パラメータも置換フィールドもない場合はフォーマット不要
+        if not kwargs and "{" not in template and "}" not in template:
+            return template
+
         try:
             return template.format(**kwargs)
         except KeyError as e:
@@ -394,5 +442,22 @@ class LanguageManager:
             logger.info(f"英語ファイルを作成しました: {en_file}")
 
 
-# シングルトンインスタンス
-language_manager = LanguageManager()
\ No newline at end of file
+# シングルトンインスタンス（初回アクセス時に生成）
+def __getattr__(name: str):
+    """
+    シングルトンインスタンスを初回アクセス時に生成する
+
+    インポートしただけで設定・言語ファイルを読み込まないよう、
+    language_manager は参照されたときに初めて作成します。
+
+    Args:
+        name: 属性名
+
+    Returns:
+        属性の値
+    """
+    if name == "language_manager":
+        global language_manager
+        language_manager = LanguageManager()
+        return language_manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -169,13 +169,16 @@ class ParallelExecutor:
             self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
             logger.debug(f"プロセスプールエグゼキュータを作成しました（ワーカー数: {self.max_workers}）")
 
-    def _task_done_callback(self, task_id: str, future: Future) -> None:
+    def _make_task_result(self, task_id: str, future: Future) -> TaskResult:
         """
-        タスク完了時のコールバック
-        
+        完了したFutureからタスク結果を作成
+
         Args:
             task_id: タスクID
-            future: Future
+            future: 完了したFuture
+
+        Returns:
+            タスク結果
         """
         try:
             result = future.result()
@@ -185,24 +188,36 @@ class ParallelExecutor:
             result = None
             success = False
             error = e
-            logger.error(f"タスク {task_id} の実行中にエラーが発生しました: {e}")
-            
-        # 結果を記録
+
         execution_time = time.time() - self.futures[task_id][1]
-        task_result = TaskResult(
+        return TaskResult(
             task_id=task_id,
             success=success,
             result=result,
             error=error,
             execution_time=execution_time
         )
+
+    def _task_done_callback(self, task_id: str, future: Future) -> None:
+        """
+        タスク完了時のコールバック
+        
+        Args:
+            task_id: タスクID
+            future: Future
+        """
+        task_result = self._make_task_result(task_id, future)
+        if not task_result.success:
+            logger.error(f"タスク {task_id} の実行中にエラーが発生しました: {task_result.error}")
+
+        # 結果を記録
         self.results[task_id] = task_result
         
         # 進捗を更新
         if self.progress_tracker:
-            self.progress_tracker.task_completed(success)
+            self.progress_tracker.task_completed(task_result.success)
             
-        logger.debug(f"タスク {task_id} が完了しました（成功: {success}, 実行時間: {execution_time:.2f}秒）")
+        logger.debug(f"タスク {task_id} が完了しました（成功: {task_result.success}, 実行時間: {task_result.execution_time:.2f}秒）")
 
     def submit_task(self, task_id: str, func: Callable[..., R], *args, **kwargs) -> Future:
         """
@@ -229,7 +244,8 @@ class ParallelExecutor:
         logger.debug(f"タスク {task_id} を投入しました")
         return future
 
-    def map(self, func: Callable[[T], R], items: List[T], task_id_prefix: str = "task") -> List[TaskResult]:
+    def map(self, func: Callable[[T], R], items: List[T], task_id_prefix: str = "task",
+            progress_callback: Optional[Callable[[int, int], None]] = None) -> List[TaskResult]:
         """
         リストの各要素に関数を適用
         
@@ -237,6 +253,7 @@ class ParallelExecutor:
             func: 適用する関数
             items: 入力リスト
             task_id_prefix: タスクIDのプレフィックス
+            progress_callback: 進捗コールバック関数 (completed_tasks, total_tasks) -> None
             
         Returns:
             タスク結果のリスト
@@ -246,17 +263,21 @@ class ParallelExecutor:
             
         # 進捗トラッカーを初期化
         self.progress_tracker = ProgressTracker(len(items))
+        if progress_callback:
+            self.progress_tracker.set_progress_callback(progress_callback)
         
         # タスクを投入
+        submitted = []
         for i, item in enumerate(items):
             task_id = f"{task_id_prefix}_{i}"
-            self.submit_task(task_id, func, item)
+            submitted.append((task_id, self.submit_task(task_id, func, item)))
             
         # 全タスクの完了を待機
-        self.wait_all()
+        concurrent.futures.wait([future for _, future in submitted])
         
-        # 結果を返す（投入順に）
-        return [self.results[f"{task_id_prefix}_{i}"] for i in range(len(items))]
+        # 結果を投入順に返す
+        # 完了コールバックはwait()の復帰後も実行中の場合があるため、self.resultsではなくFutureから直接取得する
+        return [self._make_task_result(task_id, future) for task_id, future in submitted]
 
     def execute_tasks(self, tasks: Dict[str, Tuple[Callable[..., R], List, Dict]]) -> Dict[str, TaskResult]:
         """
@@ -275,13 +296,16 @@ class ParallelExecutor:
         self.progress_tracker = ProgressTracker(len(tasks))
         
         # タスクを投入
-        for task_id, (func, args, kwargs) in tasks.items():
-            self.submit_task(task_id, func, *args, **kwargs)
+        submitted = {
+            task_id: self.submit_task(task_id, func, *args, **kwargs)
+            for task_id, (func, args, kwargs) in tasks.items()
+        }
             
         # 全タスクの完了を待機
-        self.wait_all()
+        concurrent.futures.wait(submitted.values())
         
-        return self.results
+        # 完了コールバックの実行を待たずに済むよう、Futureから直接結果を取得する
+        return {task_id: self._make_task_result(task_id, future) for task_id, future in submitted.items()}
 
     def wait_all(self) -> None:
         """全タスクの完了を待機"""
@@ -388,7 +412,8 @@ class ParallelExecutor:
 # 便利な関数
 def parallel_map(func: Callable[[T], R], items: List[T], 
                 mode: ParallelExecutionMode = ParallelExecutionMode.THREAD,
-                max_workers: Optional[int] = None) -> List[R]:
+                max_workers: Optional[int] = None,
+                progress_callback: Optional[Callable[[int, int], None]] = None) -> List[R]:
     """
     リストの各要素に関数を並列適用
     
@@ -397,12 +422,13 @@ def parallel_map(func: Callable[[T], R], items: List[T],
         items: 入力リスト
         mode: 並列実行モード
         max_workers: 最大ワーカー数
+        progress_callback: 各タスク完了時に呼ばれる進捗コールバック関数 (completed_tasks, total_tasks) -> None
         
     Returns:
         結果のリスト
     """
     with ParallelExecutor(mode=mode, max_workers=max_workers) as executor:
-        results = executor.map(func, items)
+        results = executor.map(func, items, progress_callback=progress_callback)
         
     # 成功したタスクの結果のみを返す
     return [r.result for r in results if r.success]